@@ -51,6 +51,7 @@ from darwin.utils import (
     AS_FRAMES_KEY,
     EXTRACT_VIEWS_KEY,
     find_files,
+    iter_files,
     urljoin,
 )
 
@@ -1026,7 +1027,7 @@ def _find_files_to_upload_as_single_file_items(
     ):
         raise ValueError("Cannot specify a path when uploading a LocalFile object.")
 
-    for found_file in find_files(search_files, files_to_exclude=files_to_exclude):
+    for found_file in iter_files(search_files, files_to_exclude=files_to_exclude):
         local_path = path
         if preserve_folders:
             source_files = [
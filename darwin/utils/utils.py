@@ -2,17 +2,22 @@
 Contains several unrelated utility functions used across the SDK.
 """
 
+import concurrent.futures
+import os
 import platform
 import re
+from collections import deque
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
     Any,
+    Deque,
     Dict,
     Iterable,
     Iterator,
     List,
     Optional,
+    Pattern,
     Set,
     Tuple,
     Union,
@@ -74,6 +79,21 @@ SUPPORTED_VIDEO_EXTENSIONS = [
 ]
 SUPPORTED_EXTENSIONS = SUPPORTED_IMAGE_EXTENSIONS + SUPPORTED_VIDEO_EXTENSIONS
 
+
+def _compile_extensions_pattern(extensions: Iterable[str]) -> Pattern[str]:
+    unique_extensions = sorted({ext.lower() for ext in extensions})
+    return re.compile(
+        "(?:" + "|".join(map(re.escape, unique_extensions)) + r")\Z", re.IGNORECASE
+    )
+
+
+# Precompiled, so each filename is checked with a single call into the regex engine
+_SUPPORTED_IMAGE_EXTENSIONS_RE = _compile_extensions_pattern(SUPPORTED_IMAGE_EXTENSIONS)
+_SUPPORTED_EXTENSIONS_RE = _compile_extensions_pattern(SUPPORTED_EXTENSIONS)
+
+# The number of directory listings the parallel walk of _scan_directory keeps in flight
+_SCAN_DIRECTORY_PREFETCH = 4
+
 # Define incompatible `item_merge_mode` arguments
 PRESERVE_FOLDERS_KEY = "preserve_folders"
 AS_FRAMES_KEY = "as_frames"
@@ -153,7 +173,7 @@ def is_extension_allowed_by_filename(filename: str) -> bool:
     bool
         Whether or not the given extension of the filename is allowed.
     """
-    return any(filename.lower().endswith(ext) for ext in SUPPORTED_EXTENSIONS)
+    return _SUPPORTED_EXTENSIONS_RE.search(filename) is not None
 
 
 def is_image_extension_allowed_by_filename(filename: str) -> bool:
@@ -170,7 +190,7 @@ def is_image_extension_allowed_by_filename(filename: str) -> bool:
     bool
         Whether or not the given extension is allowed.
     """
-    return any(filename.lower().endswith(ext) for ext in SUPPORTED_IMAGE_EXTENSIONS)
+    return _SUPPORTED_IMAGE_EXTENSIONS_RE.search(filename) is not None
 
 
 def is_file_extension_allowed(filename: str) -> bool:
@@ -187,7 +207,7 @@ def is_file_extension_allowed(filename: str) -> bool:
     bool
         Whether or not the given extension is allowed.
     """
-    return any(filename.lower().endswith(ext) for ext in SUPPORTED_EXTENSIONS)
+    return _SUPPORTED_EXTENSIONS_RE.search(filename) is not None
 
 
 def urljoin(*parts: str) -> str:
@@ -274,16 +294,143 @@ def prompt(msg: str, default: Optional[str] = None) -> str:
     return result
 
 
+def _list_directory(directory: str) -> List[Tuple[str, bool]]:
+    """
+    Lists the entries of a single directory, pairing each path with whether it is a
+    directory. Unreadable directories are skipped, as ``Path.glob`` does.
+
+    Parameters
+    ----------
+    directory : str
+        The directory to list.
+
+    Returns
+    -------
+    List[Tuple[str, bool]]
+        The path of every entry, and whether it is a directory. Symlinks are not followed.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return [
+                (entry.path, entry.is_dir(follow_symlinks=False)) for entry in entries
+            ]
+    except OSError:
+        return []
+
+
+def _scan_directory(
+    directory: str, recursive: bool, parallel: bool = False
+) -> Iterator[str]:
+    """
+    Yields the paths of all entries in the given directory, like ``Path.glob("*")``, or
+    ``Path.glob("**/*")`` when recursive. Walks with ``os.scandir`` so that the file type
+    check reuses the directory entry instead of issuing a ``stat`` per path.
+
+    Parameters
+    ----------
+    directory : str
+        The directory to scan.
+    recursive : bool
+        Flag for descending into subdirectories. Symlinked directories are not followed.
+    parallel : bool, default: False
+        Flag for listing up to ``_SCAN_DIRECTORY_PREFETCH`` pending subdirectories on a
+        thread pool, ahead of the consumer. Pays off on network filesystems where every
+        ``scandir`` is a round trip. Entries are then yielded breadth first.
+
+    Returns
+    -------
+    Iterator[str]
+        The paths of the entries found, prefixed by ``directory``.
+    """
+    if not parallel:
+        pending = [directory]
+        while pending:
+            for path, is_dir in _list_directory(pending.pop()):
+                yield path
+                if recursive and is_dir:
+                    pending.append(path)
+        return
+
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=_SCAN_DIRECTORY_PREFETCH
+    ) as executor:
+        # Directories waiting to be listed are queued as plain paths, so at most
+        # _SCAN_DIRECTORY_PREFETCH listings are held ahead of the consumer
+        unlisted = deque([directory])
+        listings: Deque[concurrent.futures.Future] = deque()
+        while unlisted or listings:
+            while unlisted and len(listings) < _SCAN_DIRECTORY_PREFETCH:
+                listings.append(executor.submit(_list_directory, unlisted.popleft()))
+            for path, is_dir in listings.popleft().result():
+                yield path
+                if recursive and is_dir:
+                    unlisted.append(path)
+
+
+def iter_files(
+    files: List[dt.PathLike],
+    *,
+    files_to_exclude: List[dt.PathLike] = [],
+    recursive: bool = True,
+    parallel: bool = False,
+) -> Iterator[Path]:
+    """
+    Lazily yields all files belonging to supported extensions, in the order they are found.
+    The exploration can be made recursive and a list of files can be excluded if desired.
+
+    Parameters
+    ----------
+    files: List[dt.PathLike]
+        List of files that will be filtered with the supported file extensions and yielded.
+    files_to_exclude : List[dt.PathLike]
+        List of files to exclude from the search.
+    recursive : bool
+        Flag for recursive search.
+    parallel : bool, default: False
+        Flag for listing subdirectories concurrently. Changes the order the files are found in.
+
+    Yields
+    ------
+    Path
+        The next file belonging to supported extensions.
+
+    Raises
+    ------
+    UnsupportedFileType
+        When one of the given ``files`` is neither a directory nor a supported file.
+    """
+    files_to_exclude_full_paths = {str(Path(f)) for f in files_to_exclude}
+
+    for f in files:
+        path = Path(f)
+        if path.is_dir():
+            candidates: Iterable[Path] = (
+                Path(entry_path)
+                for entry_path in _scan_directory(str(path), recursive, parallel)
+                if _SUPPORTED_EXTENSIONS_RE.search(entry_path)
+            )
+        elif is_extension_allowed_by_filename(str(path)):
+            candidates = (path,)
+        else:
+            raise UnsupportedFileType(path)
+
+        for candidate in candidates:
+            if str(candidate) not in files_to_exclude_full_paths:
+                yield candidate
+
+
 def find_files(
     files: List[dt.PathLike],
     *,
     files_to_exclude: List[dt.PathLike] = [],
     recursive: bool = True,
     sort: bool = False,
+    parallel: bool = False,
 ) -> List[Path]:
     """
     Retrieve a list of all files belonging to supported extensions. The exploration can be made
-    recursive and a list of files can be excluded if desired.
+    recursive and a list of files can be excluded if desired. See ``iter_files`` to consume the
+    files as they are found instead.
 
     Parameters
     ----------
@@ -295,37 +442,23 @@ def find_files(
         Flag for recursive search.
     sort : bool
         Flag for sorting the files naturally, i.e. file2.txt will come before file10.txt.
+    parallel : bool, default: False
+        Flag for listing subdirectories concurrently, see ``iter_files``.
+
     Returns
     -------
     List[Path]
         List of all files belonging to supported extensions. Can't return None.
     """
-
-    found_files: List[Path] = []
-    pattern = "**/*" if recursive else "*"
-
-    for f in files:
-        path = Path(f)
-        if path.is_dir():
-            found_files.extend(
-                [
-                    path_object
-                    for path_object in path.glob(pattern)
-                    if is_extension_allowed_by_filename(str(path_object))
-                ]
-            )
-        elif is_extension_allowed_by_filename(str(path)):
-            found_files.append(path)
-        else:
-            raise UnsupportedFileType(path)
-
-    files_to_exclude_full_paths = [str(Path(f)) for f in files_to_exclude]
-    filtered_files = [
-        f for f in found_files if str(f) not in files_to_exclude_full_paths
-    ]
+    found_files = iter_files(
+        files,
+        files_to_exclude=files_to_exclude,
+        recursive=recursive,
+        parallel=parallel,
+    )
     if sort:
-        return natsorted(filtered_files)
-    return filtered_files
+        return natsorted(found_files)
+    return list(found_files)
 
 
 def secure_continue_request() -> bool:
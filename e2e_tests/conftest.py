@@ -9,7 +9,7 @@ import pytest
 import tempfile
 
 from darwin.future.data_objects.typing import UnknownType
-from e2e_tests.exceptions import E2EEnvironmentVariableNotSet
+from e2e_tests.exceptions import E2EEnvironmentVariableNotSet, E2EException
 from e2e_tests.objects import ConfigValues, E2EDataset
 from e2e_tests.helpers import new_dataset  # noqa: F401
 from e2e_tests.setup_tests import (
@@ -47,6 +47,12 @@ def pytest_sessionstart(session: pytest.Session) -> None:
     if team_slug is None:
         raise E2EEnvironmentVariableNotSet("E2E_TEAM")
 
+    # Validated once here so that API helpers can trust the server URL
+    if not server.startswith("http"):
+        raise E2EException(
+            f"Invalid server URL {server} - need to specify protocol in var E2E_ENVIRONMENT"
+        )
+
     if not isinstance(session.config.cache, pytest.Cache):
         raise TypeError("Pytest caching is not enabled, but E2E tests require it")
 
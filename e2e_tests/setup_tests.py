@@ -1,4 +1,6 @@
 import base64
+import concurrent.futures
+import mmap
 import random
 import string
 from pathlib import Path
@@ -19,6 +21,18 @@ from e2e_tests.objects import (
     E2EItemLevelProperty,
 )
 
+# The static fields of every item uploaded by `create_item`
+ITEM_UPLOAD_TEMPLATE = {
+    "as_frames": False,
+    "extract_views": False,
+    "fps": "native",
+    "metadata": {},
+    "path": "/",
+    "tags": ["tag"],
+    "type": "image",
+}
+ITEM_UPLOAD_OPTIONS = {"force_tiling": False, "ignore_dicom_layout": False}
+
 
 def api_call(
     verb: Literal["get", "post", "put", "delete"],
@@ -89,6 +103,8 @@ def add_properties_to_class(
 ) -> None:
     """
     Adds a single-select & a mulit-select property to the given class, each with two values
+
+    The two properties are independent of each other, so they are created concurrently
     """
     url = f"{config.server}/api/v2/teams/{config.team_slug}/properties"
 
@@ -97,8 +113,8 @@ def add_properties_to_class(
         "content-type": "application/json",
         "Authorization": f"ApiKey {config.api_key}",
     }
-    for property_type in ["single_select", "multi_select"]:
-        payload = {
+    payloads = [
+        {
             "required": False,
             "type": property_type,
             "name": f"{property_type}-1",
@@ -108,7 +124,14 @@ def add_properties_to_class(
             ],
             "annotation_class_id": annotation_class_info["id"],
         }
-        requests.post(url, json=payload, headers=headers)
+        for property_type in ["single_select", "multi_select"]
+    ]
+
+    def create_property(payload: Dict) -> requests.Response:
+        return requests.post(url, json=payload, headers=headers)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(payloads)) as executor:
+        list(executor.map(create_property, payloads))
 
 
 def generate_random_string(
@@ -150,11 +173,6 @@ def create_dataset(prefix: str, config: ConfigValues) -> E2EDataset:
     host, api_key = config.server, config.api_key
     url = f"{host}/api/datasets"
 
-    if not url.startswith("http"):
-        raise E2EException(
-            f"Invalid server URL {host} - need to specify protocol in var E2E_ENVIRONMENT"
-        )
-
     try:
         response = api_call("post", url, {"name": name}, api_key)
 
@@ -353,8 +371,29 @@ def delete_item_level_property(id: str, config: ConfigValues) -> None:
         pytest.exit("Test run failed in test setup stage")
 
 
+def encode_image(image: Path) -> str:
+    """
+    Base64-encodes the given image file
+
+    Parameters
+    ----------
+    image : Path
+        The path to the image to encode
+
+    Returns
+    -------
+    str
+        The base64 encoded contents of the image
+    """
+    # Encode straight from the mapped file rather than reading a copy of it first
+    with image.open("rb") as f, mmap.mmap(
+        f.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mapped_image:
+        return base64.b64encode(mapped_image).decode("utf-8")
+
+
 def create_item(
-    dataset_slug: str, prefix: str, image: Path, config: ConfigValues
+    dataset_slug: str, prefix: str, base64_image: str, config: ConfigValues
 ) -> E2EItem:
     """
     Creates a randomised new item, and return its minimal info for reference
@@ -363,6 +402,8 @@ def create_item(
     ----------
     prefix : str
         The prefix to use for the item name
+    base64_image : str
+        The base64 encoded image to upload as the item, see ``encode_image``
     config : ConfigValues
         The config values to use
 
@@ -377,7 +418,6 @@ def create_item(
     url = f"{host}/api/v2/teams/{team_slug}/items/direct_upload"
 
     try:
-        base64_image = base64.b64encode(image.read_bytes()).decode("utf-8")
         response = api_call(
             "post",
             url,
@@ -385,18 +425,12 @@ def create_item(
                 "dataset_slug": dataset_slug,
                 "items": [
                     {
-                        "as_frames": False,
-                        "extract_views": False,
+                        **ITEM_UPLOAD_TEMPLATE,
                         "file_content": base64_image,
-                        "fps": "native",
-                        "metadata": {},
                         "name": f"some-item_{generate_random_string(4)}",
-                        "path": "/",
-                        "tags": ["tag"],
-                        "type": "image",
                     }
                 ],
-                "options": {"force_tiling": False, "ignore_dicom_layout": False},
+                "options": ITEM_UPLOAD_OPTIONS,
             },
             api_key,
         )
@@ -470,6 +504,9 @@ def setup_datasets(config: ConfigValues) -> List[E2EDataset]:
     """
     Setup data for End to end test runs
 
+    A single random image is generated and uploaded as every item, so it is only
+    created and encoded once per run
+
     Parameters
     ----------
     config : ConfigValues
@@ -492,12 +529,15 @@ def setup_datasets(config: ConfigValues) -> List[E2EDataset]:
             prefix = generate_random_string()
             print(f"Using prefix {prefix}")
 
+            base64_image = encode_image(
+                create_random_image(prefix, Path(temp_directory))
+            )
+
             for _ in range(number_of_datasets):
                 dataset = create_dataset(prefix, config)
 
                 for _ in range(number_of_items):
-                    image_for_item = create_random_image(prefix, Path(temp_directory))
-                    item = create_item(dataset.name, prefix, image_for_item, config)
+                    item = create_item(dataset.name, prefix, base64_image, config)
 
                     dataset.add_item(item)
 
@@ -4,7 +4,7 @@ import types
 import zipfile
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Generator, List, Tuple
 from unittest.mock import MagicMock, patch
 import numpy as np
 
@@ -12,6 +12,7 @@ import orjson as json
 import pytest
 import responses
 from pydantic import ValidationError
+from darwin.backend_v2 import BackendV2
 from darwin.client import Client
 from darwin.config import Config
 from darwin.dataset import RemoteDataset
@@ -36,6 +37,25 @@ from darwin.exceptions import UnsupportedExportFormat, UnsupportedFileType
 from darwin.item import DatasetItem
 from tests.fixtures import *
 
+_PUSH_TEST_EXTENSIONS = (
+    ".png",
+    ".jpeg",
+    ".jpg",
+    ".jfif",
+    ".tif",
+    ".tiff",
+    ".bmp",
+    ".svs",
+    ".avi",
+    ".bpm",
+    ".dcm",
+    ".mov",
+    ".mp4",
+    ".pdf",
+    ".ndpi",
+)
+_PUSH_TEST_FILENAMES = tuple(f"test{extension}" for extension in _PUSH_TEST_EXTENSIONS)
+
 
 @pytest.fixture
 def mock_is_file_extension_allowed():
@@ -48,7 +68,7 @@ def annotation_name() -> str:
     return "test_video.json"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def annotation_content() -> Dict[str, Any]:
     # return {
     #     "image": {
@@ -165,20 +185,50 @@ def annotation_content() -> Dict[str, Any]:
     }
 
 
+def _make_client(
+    config_path: Path, datasets_path: Path, team_slug_darwin_json_v2: str
+) -> Client:
+    config = Config(config_path)
+    # Only the last put persists, so the config file is written once
+    config.put(["global", "api_endpoint"], "http://localhost/api", save=False)
+    config.put(["global", "base_url"], "http://localhost", save=False)
+    config.put(
+        ["teams", team_slug_darwin_json_v2, "api_key"], "mock_api_key", save=False
+    )
+    config.put(["teams", team_slug_darwin_json_v2, "datasets_dir"], str(datasets_path))
+    return Client(config)
+
+
 @pytest.fixture
 def darwin_client(
     darwin_config_path: Path,
     darwin_datasets_path: Path,
     team_slug_darwin_json_v2: str,
 ) -> Client:
-    config = Config(darwin_config_path)
-    config.put(["global", "api_endpoint"], "http://localhost/api")
-    config.put(["global", "base_url"], "http://localhost")
-    config.put(["teams", team_slug_darwin_json_v2, "api_key"], "mock_api_key")
-    config.put(
-        ["teams", team_slug_darwin_json_v2, "datasets_dir"], str(darwin_datasets_path)
+    return _make_client(
+        darwin_config_path, darwin_datasets_path, team_slug_darwin_json_v2
+    )
+
+
+@pytest.fixture(scope="module")
+def shared_remote_dataset(
+    tmp_path_factory: pytest.TempPathFactory,
+    dataset_name: str,
+    dataset_slug: str,
+    team_slug_darwin_json_v2: str,
+) -> RemoteDatasetV2:
+    # Shared by tests that stub every dataset call they make; do not mutate
+    darwin_path = tmp_path_factory.mktemp("darwin-test")
+    client = _make_client(
+        darwin_path / "config.yaml", darwin_path / "datasets", team_slug_darwin_json_v2
+    )
+    return RemoteDatasetV2(
+        client=client,
+        team=team_slug_darwin_json_v2,
+        name=dataset_name,
+        slug=dataset_slug,
+        dataset_id=1,
     )
-    return Client(config)
 
 
 @pytest.fixture
@@ -200,12 +250,10 @@ def create_annotation_file(
     )
     annotations.mkdir(exist_ok=True, parents=True)
 
-    with (annotations / annotation_name).open("w") as f:
-        op = json.dumps(annotation_content).decode("utf-8")
-        f.write(op)
+    (annotations / annotation_name).write_bytes(json.dumps(annotation_content))
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def files_content() -> Dict[str, Any]:
     return {
         "items": [
@@ -275,7 +323,7 @@ def files_content() -> Dict[str, Any]:
                             "frames_manifests": [
                                 {
                                     "total_frames": 611,
-                                    "url": "https://darwin.v7labs.com/s/data/teams/3961/partition_53/018cf7e3-a43d-8d2b-cc04-375004360f51/uploads/fc994bd0-61a7-4c1f-b9d2-0715b3c51e13.mp4/frames_manifest.txt?token=SFMyNTY.eyJleHAiOjE3MDcwNjkxOTcsImtleV9wcmVmaXgiOiJkYXRhL3RlYW1zLzM5NjEvcGFydGl0aW9uXzUzLzAxOGNmN2UzLWE0M2QtOGQyYi1jYzA0LTM3NTAwNDM2MGY1MS8ifQ.A5lUGz5VFnzEs6NUi4vYw9mw17kqGSzu0FVoBBt1oXE",
+                                    "url": "https://localhost/frames_manifest.txt",
                                     "visible_frames": 25,
                                 }
                             ],
@@ -337,6 +385,11 @@ def files_content() -> Dict[str, Any]:
     }
 
 
+@pytest.fixture(scope="session")
+def files_content_bytes(files_content: Dict[str, Any]) -> bytes:
+    return json.dumps(files_content)
+
+
 @pytest.fixture()
 def unprocessed_file_content() -> Dict[str, Any]:
     return {
@@ -407,25 +460,131 @@ def setup_zip():
         yield Path(tmpdir)
 
 
+EXPECTED_VIDEO_FRAME_0 = {
+    "version": "2.0",
+    "schema_ref": "https://darwin-public.s3.eu-west-1.amazonaws.com/darwin_json/2.0/schema.json",
+    "item": {
+        "name": "test_video/0000000.png",
+        "path": "/test_video",
+        "source_info": {
+            "dataset": {
+                "name": "v7-darwin-json-v2",
+                "slug": "v7-darwin-json-v2",
+            },
+            "item_id": "test_item_id",
+            "team": {
+                "name": "v7-darwin-json-v2",
+                "slug": "v7-darwin-json-v2",
+            },
+            "workview_url": "test_url",
+        },
+        "slots": [
+            {
+                "type": "video",
+                "slot_name": "0",
+                "width": 1920,
+                "height": 1080,
+                "thumbnail_url": "",
+                "source_files": [{"file_name": "test_video.png", "url": ""}],
+            }
+        ],
+    },
+    "annotations": [
+        {
+            "id": "test_id",
+            "name": "test_class",
+            "polygon": {
+                "paths": [[{"x": 0, "y": 0}, {"x": 1, "y": 1}, {"x": 1, "y": 0}]]
+            },
+            "bounding_box": {"h": 1, "w": 1, "x": 0, "y": 0},
+        }
+    ],
+}
+
+EXPECTED_VIDEO_FRAME_1 = {
+    "version": "2.0",
+    "schema_ref": "https://darwin-public.s3.eu-west-1.amazonaws.com/darwin_json/2.0/schema.json",
+    "item": {
+        "name": "test_video/0000001.png",
+        "path": "/test_video",
+        "source_info": {
+            "dataset": {
+                "name": "v7-darwin-json-v2",
+                "slug": "v7-darwin-json-v2",
+            },
+            "item_id": "test_item_id",
+            "team": {
+                "name": "v7-darwin-json-v2",
+                "slug": "v7-darwin-json-v2",
+            },
+            "workview_url": "test_url",
+        },
+        "slots": [
+            {
+                "type": "video",
+                "slot_name": "0",
+                "width": 1920,
+                "height": 1080,
+                "thumbnail_url": "",
+                "source_files": [{"file_name": "test_video.png", "url": ""}],
+            }
+        ],
+    },
+    "annotations": [],
+}
+
+EXPECTED_VIDEO_FRAME_2 = {
+    "version": "2.0",
+    "schema_ref": "https://darwin-public.s3.eu-west-1.amazonaws.com/darwin_json/2.0/schema.json",
+    "item": {
+        "name": "test_video/0000002.png",
+        "path": "/test_video",
+        "source_info": {
+            "dataset": {
+                "name": "v7-darwin-json-v2",
+                "slug": "v7-darwin-json-v2",
+            },
+            "item_id": "test_item_id",
+            "team": {
+                "name": "v7-darwin-json-v2",
+                "slug": "v7-darwin-json-v2",
+            },
+            "workview_url": "test_url",
+        },
+        "slots": [
+            {
+                "type": "video",
+                "slot_name": "0",
+                "width": 1920,
+                "height": 1080,
+                "thumbnail_url": "",
+                "source_files": [{"file_name": "test_video.png", "url": ""}],
+            }
+        ],
+    },
+    "annotations": [
+        {
+            "id": "test_id",
+            "name": "test_class",
+            "polygon": {
+                "paths": [[{"x": 5, "y": 5}, {"x": 6, "y": 6}, {"x": 6, "y": 5}]]
+            },
+            "bounding_box": {"h": 1, "w": 1, "x": 5, "y": 5},
+        }
+    ],
+}
+
+
 @pytest.mark.usefixtures("file_read_write_test", "create_annotation_file")
 class TestSplitVideoAnnotations:
     def test_works_on_videos(
         self,
-        darwin_client: Client,
+        remote_dataset: RemoteDatasetV2,
         darwin_datasets_path: Path,
-        dataset_name: str,
         dataset_slug: str,
         release_name: str,
         team_slug_darwin_json_v2: str,
     ):
-        remote_dataset = RemoteDatasetV2(
-            client=darwin_client,
-            team=team_slug_darwin_json_v2,
-            name=dataset_name,
-            slug=dataset_slug,
-            dataset_id=1,
-        )
-
         remote_dataset.split_video_annotations()
 
         video_path = (
@@ -443,225 +602,75 @@ class TestSplitVideoAnnotations:
         assert (video_path / "0000002.json").exists()
         assert not (video_path / "0000003.json").exists()
 
-        with (video_path / "0000000.json").open() as f:
-            assert json.loads(f.read()) == {
-                "version": "2.0",
-                "schema_ref": "https://darwin-public.s3.eu-west-1.amazonaws.com/darwin_json/2.0/schema.json",
-                "item": {
-                    "name": "test_video/0000000.png",
-                    "path": "/test_video",
-                    "source_info": {
-                        "dataset": {
-                            "name": "v7-darwin-json-v2",
-                            "slug": "v7-darwin-json-v2",
-                        },
-                        "item_id": "test_item_id",
-                        "team": {
-                            "name": "v7-darwin-json-v2",
-                            "slug": "v7-darwin-json-v2",
-                        },
-                        "workview_url": "test_url",
-                    },
-                    "slots": [
-                        {
-                            "type": "video",
-                            "slot_name": "0",
-                            "width": 1920,
-                            "height": 1080,
-                            "thumbnail_url": "",
-                            "source_files": [
-                                {"file_name": "test_video.png", "url": ""}
-                            ],
-                        }
-                    ],
-                },
-                "annotations": [
-                    {
-                        "id": "test_id",
-                        "name": "test_class",
-                        "polygon": {
-                            "paths": [
-                                [{"x": 0, "y": 0}, {"x": 1, "y": 1}, {"x": 1, "y": 0}]
-                            ]
-                        },
-                        "bounding_box": {"h": 1, "w": 1, "x": 0, "y": 0},
-                    }
-                ],
-            }
+        results = {
+            p.name: json.loads(p.read_bytes())
+            for p in sorted(video_path.glob("*.json"))
+        }
 
-        with (video_path / "0000001.json").open() as f:
-            assert json.loads(f.read()) == {
-                "version": "2.0",
-                "schema_ref": "https://darwin-public.s3.eu-west-1.amazonaws.com/darwin_json/2.0/schema.json",
-                "item": {
-                    "name": "test_video/0000001.png",
-                    "path": "/test_video",
-                    "source_info": {
-                        "dataset": {
-                            "name": "v7-darwin-json-v2",
-                            "slug": "v7-darwin-json-v2",
-                        },
-                        "item_id": "test_item_id",
-                        "team": {
-                            "name": "v7-darwin-json-v2",
-                            "slug": "v7-darwin-json-v2",
-                        },
-                        "workview_url": "test_url",
-                    },
-                    "slots": [
-                        {
-                            "type": "video",
-                            "slot_name": "0",
-                            "width": 1920,
-                            "height": 1080,
-                            "thumbnail_url": "",
-                            "source_files": [
-                                {"file_name": "test_video.png", "url": ""}
-                            ],
-                        }
-                    ],
-                },
-                "annotations": [],
-            }
+        assert results["0000000.json"] == EXPECTED_VIDEO_FRAME_0
+        assert results["0000001.json"] == EXPECTED_VIDEO_FRAME_1
+        assert results["0000002.json"] == EXPECTED_VIDEO_FRAME_2
 
-        with (video_path / "0000002.json").open() as f:
-            assert json.loads(f.read()) == {
-                "version": "2.0",
-                "schema_ref": "https://darwin-public.s3.eu-west-1.amazonaws.com/darwin_json/2.0/schema.json",
-                "item": {
-                    "name": "test_video/0000002.png",
-                    "path": "/test_video",
-                    "source_info": {
-                        "dataset": {
-                            "name": "v7-darwin-json-v2",
-                            "slug": "v7-darwin-json-v2",
-                        },
-                        "item_id": "test_item_id",
-                        "team": {
-                            "name": "v7-darwin-json-v2",
-                            "slug": "v7-darwin-json-v2",
-                        },
-                        "workview_url": "test_url",
-                    },
-                    "slots": [
-                        {
-                            "type": "video",
-                            "slot_name": "0",
-                            "width": 1920,
-                            "height": 1080,
-                            "thumbnail_url": "",
-                            "source_files": [
-                                {"file_name": "test_video.png", "url": ""}
-                            ],
-                        }
-                    ],
-                },
-                "annotations": [
-                    {
-                        "id": "test_id",
-                        "name": "test_class",
-                        "polygon": {
-                            "paths": [
-                                [{"x": 5, "y": 5}, {"x": 6, "y": 6}, {"x": 6, "y": 5}]
-                            ]
-                        },
-                        "bounding_box": {"h": 1, "w": 1, "x": 5, "y": 5},
-                    }
-                ],
-            }
+
+FETCH_ITEMS_URL = "http://localhost/api/v2/teams/v7-darwin-json-v2/items?page%5Bsize%5D=500&include_workflow_data=true&dataset_ids%5B%5D=1"
+FETCH_ITEMS_WITH_COMMAS_URL = "http://localhost/api/v2/teams/v7-darwin-json-v2/items?item_names%5B%5D=example%2Cwith%2C+comma.mp4&page%5Bsize%5D=500&include_workflow_data=true&dataset_ids%5B%5D=1"
 
 
-@pytest.mark.usefixtures("files_content", "file_read_write_test")
+@pytest.mark.usefixtures("file_read_write_test")
 class TestFetchRemoteFiles:
-    @responses.activate
+    @pytest.fixture(autouse=True)
+    def mocked_responses(self, files_content_bytes: bytes):
+        with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
+            for url in (FETCH_ITEMS_URL, FETCH_ITEMS_WITH_COMMAS_URL):
+                rsps.add(
+                    responses.GET,
+                    url,
+                    body=files_content_bytes,
+                    content_type="application/json",
+                    status=200,
+                )
+            yield rsps
+
     def test_works(
-        self,
-        darwin_client: Client,
-        dataset_name: str,
-        dataset_slug: str,
-        team_slug_darwin_json_v2: str,
-        files_content: dict,
+        self, remote_dataset: RemoteDatasetV2, mocked_responses: responses.RequestsMock
     ):
-        remote_dataset = RemoteDatasetV2(
-            client=darwin_client,
-            team=team_slug_darwin_json_v2,
-            name=dataset_name,
-            slug=dataset_slug,
-            dataset_id=1,
-        )
-        url = "http://localhost/api/v2/teams/v7-darwin-json-v2/items?page%5Bsize%5D=500&include_workflow_data=true&dataset_ids%5B%5D=1"
-        responses.add(
-            responses.GET,
-            url,
-            json=files_content,
-            status=200,
-        )
-
         actual = remote_dataset.fetch_remote_files()
 
         assert isinstance(actual, types.GeneratorType)
 
-        (item_1, item_2) = list(actual)
+        item_1 = next(actual)
+        item_2 = next(actual)
+        with pytest.raises(StopIteration):
+            next(actual)
 
-        assert responses.assert_call_count(url, 1) is True
+        assert mocked_responses.assert_call_count(FETCH_ITEMS_URL, 1) is True
 
         assert item_1.id == "018c6826-766c-d596-44b3-46159c7c23bc"
         assert item_2.id == "018cf7e3-a43d-8d2b-cc04-375004360f51"
 
-    @responses.activate
     def test_fetches_files_with_commas(
-        self,
-        darwin_client: Client,
-        dataset_name: str,
-        dataset_slug: str,
-        team_slug_darwin_json_v2: str,
-        files_content: dict,
+        self, remote_dataset: RemoteDatasetV2, mocked_responses: responses.RequestsMock
     ):
-        remote_dataset = RemoteDatasetV2(
-            client=darwin_client,
-            team=team_slug_darwin_json_v2,
-            name=dataset_name,
-            slug=dataset_slug,
-            dataset_id=1,
-        )
-        url = "http://localhost/api/v2/teams/v7-darwin-json-v2/items?item_names%5B%5D=example%2Cwith%2C+comma.mp4&page%5Bsize%5D=500&include_workflow_data=true&dataset_ids%5B%5D=1"
-        responses.add(
-            responses.GET,
-            url,
-            json=files_content,
-            status=200,
-        )
-
         filters = {"item_names": ["example,with, comma.mp4"]}
 
         list(remote_dataset.fetch_remote_files(filters))
 
         assert (
-            responses.calls[0].request.params["item_names[]"]
+            mocked_responses.calls[0].request.params["item_names[]"]
             == "example,with, comma.mp4"
         )
 
-    @responses.activate
     def test_returns_unprocessed_files(
         self,
-        darwin_client: Client,
-        dataset_name: str,
-        dataset_slug: str,
-        team_slug_darwin_json_v2: str,
+        remote_dataset: RemoteDatasetV2,
+        mocked_responses: responses.RequestsMock,
         unprocessed_file_content: dict,
     ):
-        remote_dataset = RemoteDatasetV2(
-            client=darwin_client,
-            team=team_slug_darwin_json_v2,
-            name=dataset_name,
-            slug=dataset_slug,
-            dataset_id=1,
-        )
-        url = "http://localhost/api/v2/teams/v7-darwin-json-v2/items?item_names%5B%5D=example%2Cwith%2C+comma.mp4&page%5Bsize%5D=500&include_workflow_data=true&dataset_ids%5B%5D=1"
-        responses.add(
+        mocked_responses.replace(
             responses.GET,
-            url,
-            json=unprocessed_file_content,
+            FETCH_ITEMS_WITH_COMMAS_URL,
+            body=json.dumps(unprocessed_file_content),
+            content_type="application/json",
             status=200,
         )
         filters = {"item_names": ["example,with, comma.mp4"]}
@@ -669,7 +678,7 @@ class TestFetchRemoteFiles:
         list(remote_dataset.fetch_remote_files(filters))
 
         assert (
-            responses.calls[0].request.params["item_names[]"]
+            mocked_responses.calls[0].request.params["item_names[]"]
             == "example,with, comma.mp4"
         )
 
@@ -748,80 +757,67 @@ class TestFetchRemoteClasses:
 
 
 @pytest.fixture
-def remote_dataset(
-    darwin_client: Client,
-    dataset_name: str,
-    dataset_slug: str,
-    team_slug_darwin_json_v2: str,
-):
-    return RemoteDatasetV2(
-        client=darwin_client,
-        team=team_slug_darwin_json_v2,
-        name=dataset_name,
-        slug=dataset_slug,
-        dataset_id=1,
+def upload_mocks(monkeypatch: pytest.MonkeyPatch) -> Tuple[MagicMock, MagicMock]:
+    request_upload_mock = MagicMock(return_value=([], []))
+    upload_mock = MagicMock()
+    monkeypatch.setattr(UploadHandlerV2, "_request_upload", request_upload_mock)
+    monkeypatch.setattr(UploadHandlerV2, "upload", upload_mock)
+    return request_upload_mock, upload_mock
+
+
+def assert_upload_mocks_are_correctly_called(
+    upload_mocks: Tuple[MagicMock, MagicMock]
+) -> None:
+    request_upload_mock, upload_mock = upload_mocks
+    request_upload_mock.assert_called_once()
+    upload_mock.assert_called_once_with(
+        multi_threaded=True,
+        progress_callback=None,
+        file_upload_callback=None,
+        max_workers=None,
     )
 
 
 @pytest.mark.usefixtures("file_read_write_test")
 class TestPush:
-    def test_raises_if_files_are_not_provided(self, remote_dataset: RemoteDataset):
-        with pytest.raises(ValueError):
-            remote_dataset.push(None)
-
-    def test_raises_if_both_path_and_local_files_are_given(
-        self, remote_dataset: RemoteDataset
-    ):
-        with pytest.raises(ValueError):
-            remote_dataset.push([LocalFile("test.jpg")], path="test")
-
-    def test_raises_if_both_fps_and_local_files_are_given(
-        self, remote_dataset: RemoteDataset
+    @pytest.mark.parametrize(
+        "files, kwargs",
+        [
+            # No files provided
+            (None, {}),
+            # Local files combined with options that only apply to paths
+            ([LocalFile("test.jpg")], {"path": "test"}),
+            ([LocalFile("test.jpg")], {"fps": 2}),
+            ([LocalFile("test.jpg")], {"as_frames": True}),
+        ],
+    )
+    def test_raises_value_error_for_invalid_arguments(
+        self, remote_dataset: RemoteDataset, files: Any, kwargs: Dict[str, Any]
     ):
         with pytest.raises(ValueError):
-            remote_dataset.push([LocalFile("test.jpg")], fps=2)
+            remote_dataset.push(files, **kwargs)
 
-    def test_raises_if_both_as_frames_and_local_files_are_given(
-        self, remote_dataset: RemoteDataset
+    @pytest.mark.parametrize(
+        "files", [[LocalFile("test.jpg")], [Path("test.jpg")], ["test.jpg"]]
+    )
+    def test_works_with_file_list(
+        self,
+        remote_dataset: RemoteDataset,
+        upload_mocks: Tuple[MagicMock, MagicMock],
+        files: list,
     ):
-        with pytest.raises(ValueError):
-            remote_dataset.push([LocalFile("test.jpg")], as_frames=True)
-
-    def test_works_with_local_files_list(self, remote_dataset: RemoteDataset):
         with patch.object(remote_dataset, "fetch_remote_files", return_value=[]):
-            assert_upload_mocks_are_correctly_called(
-                remote_dataset, [LocalFile("test.jpg")]
-            )
+            remote_dataset.push(files)
+        assert_upload_mocks_are_correctly_called(upload_mocks)
 
-    def test_works_with_path_list(self, remote_dataset: RemoteDataset):
-        with patch.object(remote_dataset, "fetch_remote_files", return_value=[]):
-            assert_upload_mocks_are_correctly_called(remote_dataset, [Path("test.jpg")])
-
-    def test_works_with_str_list(self, remote_dataset: RemoteDataset):
-        with patch.object(remote_dataset, "fetch_remote_files", return_value=[]):
-            assert_upload_mocks_are_correctly_called(remote_dataset, ["test.jpg"])
-
-    def test_works_with_supported_files(self, remote_dataset: RemoteDataset):
-        supported_extensions = [
-            ".png",
-            ".jpeg",
-            ".jpg",
-            ".jfif",
-            ".tif",
-            ".tiff",
-            ".bmp",
-            ".svs",
-            ".avi",
-            ".bpm",
-            ".dcm",
-            ".mov",
-            ".mp4",
-            ".pdf",
-            ".ndpi",
-        ]
-        filenames = [f"test{extension}" for extension in supported_extensions]
+    def test_works_with_supported_files(
+        self,
+        remote_dataset: RemoteDataset,
+        upload_mocks: Tuple[MagicMock, MagicMock],
+    ):
         with patch.object(remote_dataset, "fetch_remote_files", return_value=[]):
-            assert_upload_mocks_are_correctly_called(remote_dataset, filenames)
+            remote_dataset.push(list(_PUSH_TEST_FILENAMES))
+        assert_upload_mocks_are_correctly_called(upload_mocks)
 
     def test_raises_with_unsupported_files(self, remote_dataset: RemoteDataset):
         with pytest.raises(UnsupportedFileType):
@@ -1099,157 +1095,116 @@ class TestPushMultiChannelItem:
         }
 
 
+FROZEN_EXPORT_DATE = datetime(2024, 1, 1)
+TEST_ZIP = Path("tests/dataset.zip")
+TEST_PROPERTIES_ZIP = Path("tests/dataset_with_properties.zip")
+
+
+def _fake_download_zip(self, path):
+    shutil.copy(TEST_ZIP, path)
+    return path
+
+
+def _fake_download_properties_zip(self, path):
+    shutil.copy(TEST_PROPERTIES_ZIP, path)
+    return path
+
+
+def _stub_release(format: str) -> Release:
+    return Release(
+        "dataset-slug",
+        "team-slug",
+        "0.1.0",
+        "release-name",
+        ReleaseStatus("complete"),
+        "http://darwin-fake-url.com",
+        FROZEN_EXPORT_DATE,
+        None,
+        None,
+        True,
+        True,
+        format,
+    )
+
+
+@pytest.fixture(scope="module")
+def stub_release() -> Release:
+    return _stub_release("json")
+
+
+@pytest.fixture(scope="module")
+def stub_release_xml() -> Release:
+    return _stub_release("xml")
+
+
+@pytest.fixture
+def patched_release(stub_release: Release) -> Generator[MagicMock, None, None]:
+    with patch.object(
+        RemoteDataset, "get_release", return_value=stub_release
+    ) as get_release_stub, patch.object(
+        Release, "download_zip", new=_fake_download_zip
+    ):
+        yield get_release_stub
+
+
 @pytest.mark.usefixtures("file_read_write_test")
 class TestPull:
     @patch("platform.system", return_value="Linux")
     def test_gets_latest_release_when_not_given_one(
-        self, system_mock: MagicMock, remote_dataset: RemoteDataset
+        self,
+        system_mock: MagicMock,
+        remote_dataset: RemoteDataset,
+        patched_release: MagicMock,
     ):
-        stub_release_response = Release(
-            "dataset-slug",
-            "team-slug",
-            "0.1.0",
-            "release-name",
-            ReleaseStatus("complete"),
-            "http://darwin-fake-url.com",
-            datetime.now(),
-            None,
-            None,
-            True,
-            True,
-            "json",
-        )
-
-        def fake_download_zip(self, path):
-            zip: Path = Path("tests/dataset.zip")
-            shutil.copy(zip, path)
-            return path
-
-        with patch.object(
-            RemoteDataset, "get_release", return_value=stub_release_response
-        ) as get_release_stub:
-            with patch.object(Release, "download_zip", new=fake_download_zip):
-                remote_dataset.pull(only_annotations=True)
-                get_release_stub.assert_called_once()
+        remote_dataset.pull(only_annotations=True)
+        patched_release.assert_called_once()
 
     @patch("platform.system", return_value="Windows")
     def test_does_not_create_symlink_on_windows(
-        self, mocker: MagicMock, remote_dataset: RemoteDataset
+        self,
+        mocker: MagicMock,
+        remote_dataset: RemoteDataset,
+        patched_release: MagicMock,
     ):
-        stub_release_response = Release(
-            "dataset-slug",
-            "team-slug",
-            "0.1.0",
-            "release-name",
-            ReleaseStatus("complete"),
-            "http://darwin-fake-url.com",
-            datetime.now(),
-            None,
-            None,
-            True,
-            True,
-            "json",
-        )
-
-        def fake_download_zip(self, path):
-            zip: Path = Path("tests/dataset.zip")
-            shutil.copy(zip, path)
-            return path
-
         latest: Path = remote_dataset.local_releases_path / "latest"
 
-        with patch.object(
-            RemoteDataset, "get_release", return_value=stub_release_response
-        ):
-            with patch.object(Release, "download_zip", new=fake_download_zip):
-                remote_dataset.pull(only_annotations=True)
-                assert not latest.is_symlink()
+        remote_dataset.pull(only_annotations=True)
+        assert not latest.is_symlink()
 
     @patch("platform.system", return_value="Linux")
     def test_continues_if_symlink_creation_fails(
-        self, system_mock: MagicMock, remote_dataset: RemoteDataset
+        self,
+        system_mock: MagicMock,
+        remote_dataset: RemoteDataset,
+        patched_release: MagicMock,
     ):
-        stub_release_response = Release(
-            "dataset-slug",
-            "team-slug",
-            "0.1.0",
-            "release-name",
-            ReleaseStatus("complete"),
-            "http://darwin-fake-url.com",
-            datetime.now(),
-            None,
-            None,
-            True,
-            True,
-            "json",
-        )
-
-        def fake_download_zip(self, path):
-            zip: Path = Path("tests/dataset.zip")
-            shutil.copy(zip, path)
-            return path
-
         latest: Path = remote_dataset.local_releases_path / "latest"
 
-        with patch.object(Path, "symlink_to") as mock_symlink_to:
-            with patch.object(
-                RemoteDataset, "get_release", return_value=stub_release_response
-            ):
-                with patch.object(Release, "download_zip", new=fake_download_zip):
-                    mock_symlink_to.side_effect = OSError()
-                    remote_dataset.pull(only_annotations=True)
-                    assert not latest.is_symlink()
+        with patch.object(Path, "symlink_to", side_effect=OSError()):
+            remote_dataset.pull(only_annotations=True)
+            assert not latest.is_symlink()
 
     @patch("platform.system", return_value="Linux")
     def test_raises_if_release_format_is_not_json(
-        self, system_mock: MagicMock, remote_dataset: RemoteDataset
+        self,
+        system_mock: MagicMock,
+        remote_dataset: RemoteDataset,
+        stub_release_xml: Release,
     ):
-        a_release = Release(
-            remote_dataset.slug,
-            remote_dataset.team,
-            "0.1.0",
-            "release-name",
-            ReleaseStatus("complete"),
-            "http://darwin-fake-url.com",
-            datetime.now(),
-            None,
-            None,
-            True,
-            True,
-            "xml",
-        )
-
         with pytest.raises(UnsupportedExportFormat):
-            remote_dataset.pull(release=a_release)
+            remote_dataset.pull(release=stub_release_xml)
 
     @patch("platform.system", return_value="Linux")
     def test_moves_properties_metadata_file(
-        self, system_mock: MagicMock, remote_dataset: RemoteDataset
+        self,
+        system_mock: MagicMock,
+        remote_dataset: RemoteDataset,
+        stub_release: Release,
     ):
-        stub_release_response = Release(
-            "dataset-slug",
-            "team-slug",
-            "0.1.0",
-            "release-name",
-            ReleaseStatus("complete"),
-            "http://darwin-fake-url.com",
-            datetime.now(),
-            None,
-            None,
-            True,
-            True,
-            "json",
-        )
-
-        def fake_download_zip(self, path):
-            zip: Path = Path("tests/dataset_with_properties.zip")
-            shutil.copy(zip, path)
-            return path
-
-        with patch.object(
-            RemoteDataset, "get_release", return_value=stub_release_response
-        ):
-            with patch.object(Release, "download_zip", new=fake_download_zip):
+        with patch.object(RemoteDataset, "get_release", return_value=stub_release):
+            with patch.object(
+                Release, "download_zip", new=_fake_download_properties_zip
+            ):
                 remote_dataset.pull(only_annotations=True)
                 metadata_path = (
                     remote_dataset.local_path
@@ -1550,94 +1505,99 @@ def dataset_item(dataset_slug: str) -> DatasetItem:
     )
 
 
-@pytest.mark.usefixtures("file_read_write_test")
-class TestArchive:
-    def test_calls_put(
-        self,
-        remote_dataset: RemoteDatasetV2,
-        dataset_item: DatasetItem,
-        team_slug_darwin_json_v2: str,
-        dataset_slug: str,
-    ):
-        with patch.object(RemoteDatasetV2, "archive", return_value={}) as stub:
-            remote_dataset.archive([dataset_item])
-            stub.assert_called_once_with([dataset_item])
-
+@pytest.fixture
+def stub_client_method(
+    monkeypatch: pytest.MonkeyPatch,
+) -> Callable[[str], List[Tuple[tuple, dict]]]:
+    # Client.api_v2 builds a new BackendV2 on every access, so stub the class
+    def make(method: str) -> List[Tuple[tuple, dict]]:
+        calls: List[Tuple[tuple, dict]] = []
+        monkeypatch.setattr(
+            BackendV2,
+            method,
+            lambda self, *args, **kwargs: calls.append((args, kwargs)) or {},
+        )
+        return calls
 
-@pytest.mark.usefixtures("file_read_write_test")
-class TestMoveToNew:
-    def test_calls_put(
-        self,
-        remote_dataset: RemoteDatasetV2,
-        dataset_item: DatasetItem,
-        team_slug_darwin_json_v2: str,
-        dataset_slug: str,
-    ):
-        with patch.object(RemoteDatasetV2, "move_to_new", return_value={}) as stub:
-            remote_dataset.move_to_new([dataset_item])
-            stub.assert_called_once_with([dataset_item])
+    return make
 
 
-@pytest.mark.usefixtures("file_read_write_test")
-class TestRestoreArchived:
-    def test_calls_put(
+class TestItemActions:
+    @pytest.mark.parametrize(
+        "method, client_method, args",
+        [
+            (
+                "archive",
+                "archive_items",
+                ({"filters": {"item_ids": [1], "dataset_ids": [1]}},),
+            ),
+            (
+                "restore_archived",
+                "restore_archived_items",
+                ({"filters": {"item_ids": [1], "dataset_ids": [1]}},),
+            ),
+            ("delete_items", "delete_items", ({"dataset_ids": [1], "item_ids": [1]},)),
+            (
+                "move_to_new",
+                "move_to_stage",
+                ({"item_ids": [1], "dataset_ids": [1]}, "stage_id", "workflow_id"),
+            ),
+        ],
+    )
+    def test_calls_client_with_payload(
         self,
-        remote_dataset: RemoteDatasetV2,
+        monkeypatch: pytest.MonkeyPatch,
+        shared_remote_dataset: RemoteDatasetV2,
         dataset_item: DatasetItem,
+        stub_client_method: Callable[[str], List[Tuple[tuple, dict]]],
         team_slug_darwin_json_v2: str,
-        dataset_slug: str,
+        method: str,
+        client_method: str,
+        args: tuple,
     ):
-        with patch.object(RemoteDatasetV2, "restore_archived", return_value={}) as stub:
-            remote_dataset.restore_archived([dataset_item])
-            stub.assert_called_once_with([dataset_item])
+        monkeypatch.setattr(
+            shared_remote_dataset,
+            "_fetch_stages",
+            lambda stage_type: (
+                "workflow_id",
+                [{"id": "stage_id"}] if stage_type == "dataset" else [],
+            ),
+        )
+        calls = stub_client_method(client_method)
+        getattr(shared_remote_dataset, method)([dataset_item])
+        assert calls == [(args, {"team_slug": team_slug_darwin_json_v2})]
 
 
-@pytest.mark.usefixtures("file_read_write_test")
-class TestDeleteItems:
-    def test_calls_delete(
+class TestExportDataset:
+    def test_honours_include_authorship(
         self,
-        remote_dataset: RemoteDatasetV2,
-        dataset_item: DatasetItem,
-        team_slug_darwin_json_v2: str,
+        shared_remote_dataset: RemoteDatasetV2,
+        stub_client_method: Callable[[str], List[Tuple[tuple, dict]]],
         dataset_slug: str,
+        team_slug_darwin_json_v2: str,
     ):
-        with patch.object(RemoteDatasetV2, "delete_items", return_value={}) as stub:
-            remote_dataset.delete_items([dataset_item])
-            stub.assert_called_once_with([dataset_item])
-
-
-def assert_upload_mocks_are_correctly_called(remote_dataset: RemoteDataset, *args):
-    with patch.object(
-        UploadHandlerV2, "_request_upload", return_value=([], [])
-    ) as request_upload_mock:
-        with patch.object(UploadHandlerV2, "upload") as upload_mock:
-            remote_dataset.push(*args)
-
-            request_upload_mock.assert_called_once()
-            upload_mock.assert_called_once_with(
-                multi_threaded=True,
-                progress_callback=None,
-                file_upload_callback=None,
-                max_workers=None,
-            )
-
-
-@pytest.mark.usefixtures("file_read_write_test")
-class TestExportDataset:
-    def test_honours_include_authorship(self, remote_dataset: RemoteDatasetV2):
-        with patch.object(RemoteDatasetV2, "export", return_value={}) as stub:
-            remote_dataset.export(
-                "example",
-                annotation_class_ids=[],
-                include_url_token=False,
-                include_authorship=True,
-            )
-            stub.assert_called_once_with(
-                "example",
-                annotation_class_ids=[],
-                include_url_token=False,
-                include_authorship=True,
+        calls = stub_client_method("export_dataset")
+        shared_remote_dataset.export(
+            "example",
+            annotation_class_ids=[],
+            include_url_token=False,
+            include_authorship=True,
+        )
+        assert calls == [
+            (
+                (),
+                {
+                    "format": None,
+                    "name": "example",
+                    "include_authorship": True,
+                    "include_token": False,
+                    "annotation_class_ids": None,
+                    "filters": None,
+                    "dataset_slug": dataset_slug,
+                    "team_slug": team_slug_darwin_json_v2,
+                },
             )
+        ]
 
 
 @pytest.mark.usefixtures("file_read_write_test")
@@ -2,7 +2,7 @@ import json
 import shutil
 import tempfile
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 import pytest
 
@@ -18,53 +18,22 @@ from darwin.datatypes import (
 )
 
 
-class TestMakePolygon:
-    def test_it_returns_annotation_with_default_params(self):
-        class_name: str = "class_name"
-        points: List[Point] = [[{"x": 1, "y": 2}, {"x": 3, "y": 4}, {"x": 1, "y": 2}]]
-        annotation = make_polygon(class_name, points)
-
-        assert_annotation_class(annotation, class_name, "polygon", "polygon")
-
-        paths = annotation.data.get("paths")
-        assert paths == points
-
-    def test_it_returns_annotation_with_bounding_box(self):
-        class_name: str = "class_name"
-        points: List[Point] = [[{"x": 1, "y": 2}, {"x": 3, "y": 4}, {"x": 1, "y": 2}]]
-        bbox: Dict[str, float] = {"x": 1, "y": 2, "w": 2, "h": 2}
-        annotation = make_polygon(class_name, points, bbox)
-
-        assert_annotation_class(annotation, class_name, "polygon", "polygon")
-
-        paths = annotation.data.get("paths")
-        assert paths == points
+POLYGON_POINTS: List[List[Point]] = [
+    [{"x": 1, "y": 2}, {"x": 3, "y": 4}, {"x": 1, "y": 2}]
+]
+COMPLEX_POLYGON_POINTS: List[List[Point]] = [
+    [{"x": 1, "y": 2}, {"x": 3, "y": 4}, {"x": 1, "y": 2}],
+    [{"x": 4, "y": 5}, {"x": 6, "y": 7}, {"x": 4, "y": 5}],
+]
 
-        class_bbox = annotation.data.get("bounding_box")
-        assert class_bbox == bbox
-
-
-class TestMakeComplexPolygon:
-    def test_it_returns_annotation_with_default_params(self):
-        class_name: str = "class_name"
-        points: List[List[Point]] = [
-            [{"x": 1, "y": 2}, {"x": 3, "y": 4}, {"x": 1, "y": 2}],
-            [{"x": 4, "y": 5}, {"x": 6, "y": 7}, {"x": 4, "y": 5}],
-        ]
-        annotation = make_polygon(class_name, points)
 
-        assert_annotation_class(annotation, class_name, "polygon", "polygon")
-
-        paths = annotation.data.get("paths")
-        assert paths == points
-
-    def test_it_returns_annotation_with_bounding_box(self):
+class TestMakePolygon:
+    @pytest.mark.parametrize("points", [POLYGON_POINTS, COMPLEX_POLYGON_POINTS])
+    @pytest.mark.parametrize("bbox", [None, {"x": 1, "y": 2, "w": 2, "h": 2}])
+    def test_it_returns_annotation(
+        self, points: List[List[Point]], bbox: Optional[Dict[str, float]]
+    ):
         class_name: str = "class_name"
-        points: List[List[Point]] = [
-            [{"x": 1, "y": 2}, {"x": 3, "y": 4}, {"x": 1, "y": 2}],
-            [{"x": 4, "y": 5}, {"x": 6, "y": 7}, {"x": 4, "y": 5}],
-        ]
-        bbox: Dict[str, float] = {"x": 1, "y": 2, "w": 2, "h": 2}
         annotation = make_polygon(class_name, points, bbox)
 
         assert_annotation_class(annotation, class_name, "polygon", "polygon")
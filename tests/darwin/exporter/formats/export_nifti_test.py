@@ -1,171 +1,131 @@
-import tempfile
+import copy
 from pathlib import Path
+from typing import Callable, Dict, List, Optional
 from unittest.mock import patch
-from zipfile import ZipFile
 
 import nibabel as nib
-import numpy as np
+import pytest
 
+import darwin.datatypes as dt
 from darwin.exporter.exporter import darwin_to_dt_gen
 from darwin.exporter.formats import nifti
 from tests.fixtures import *
 
 
-def test_video_annotation_nifti_export_single_slot(team_slug_darwin_json_v2: str):
-    with tempfile.TemporaryDirectory() as tmpdir:
-        with ZipFile("tests/data.zip") as zfile:
-            zfile.extractall(tmpdir)
-            annotations_dir = (
-                Path(tmpdir)
-                / team_slug_darwin_json_v2
-                / "nifti/releases/latest/annotations"
-            )
-            video_annotation_filepaths = [annotations_dir / "hippocampus_001.nii.json"]
-            video_annotations = list(
-                darwin_to_dt_gen(video_annotation_filepaths, False)
-            )
-            nifti.export(video_annotations, output_dir=tmpdir)
-            export_im = nib.load(
-                annotations_dir / "hippocampus_001_hippocampus.nii.gz"
-            ).get_fdata()
-            expected_im = nib.load(
-                annotations_dir / "hippocampus_001_hippocampus.nii.gz"
-            ).get_fdata()
-            assert np.allclose(export_im, expected_im)
-
-
-def test_video_annotation_nifti_export_multi_slot(team_slug_darwin_json_v2: str):
-    with tempfile.TemporaryDirectory() as tmpdir:
-        with ZipFile("tests/data.zip") as zfile:
-            zfile.extractall(tmpdir)
-            annotations_dir = (
-                Path(tmpdir)
-                / team_slug_darwin_json_v2
-                / "nifti/releases/latest/annotations"
-            )
-            video_annotation_filepaths = [
-                annotations_dir / "hippocampus_multislot.nii.json"
-            ]
-            video_annotations = list(
-                darwin_to_dt_gen(video_annotation_filepaths, False)
-            )
-            nifti.export(video_annotations, output_dir=tmpdir)
-            names = ["1", "2", "3", "4", "5"]
-            for slotname in names:
-                export_im = nib.load(
-                    annotations_dir
-                    / f"hippocampus_multislot_{slotname}_test_hippo.nii.gz"
-                ).get_fdata()
-                expected_im = nib.load(
-                    annotations_dir
-                    / f"hippocampus_multislot_{slotname}_test_hippo.nii.gz"
-                ).get_fdata()
-                assert np.allclose(export_im, expected_im)
-
-
-def test_video_annotation_nifti_export_mpr(team_slug_darwin_json_v2: str):
-    with tempfile.TemporaryDirectory() as tmpdir:
-        with ZipFile("tests/data.zip") as zfile:
-            zfile.extractall(tmpdir)
-            annotations_dir = (
-                Path(tmpdir)
-                / team_slug_darwin_json_v2
-                / "nifti/releases/latest/annotations"
-            )
-            video_annotation_filepaths = [
-                annotations_dir / "hippocampus_multislot_001_mpr.json"
-            ]
-            video_annotations = list(
-                darwin_to_dt_gen(video_annotation_filepaths, False)
-            )
-            nifti.export(video_annotations, output_dir=Path(tmpdir))
-            export_im = nib.load(
-                annotations_dir / "hippocampus_001_mpr_1_test_hippo.nii.gz"
-            ).get_fdata()
-            expected_im = nib.load(
-                annotations_dir / "hippocampus_001_mpr_1_test_hippo.nii.gz"
-            ).get_fdata()
-            assert np.allclose(export_im, expected_im)
-
-
-def test_export_calls_populate_output_volumes_from_polygons(
-    team_slug_darwin_json_v2: str,
+@pytest.fixture(scope="session")
+def annotations_dir(extracted_data_dir: Path, team_slug_darwin_json_v2: str) -> Path:
+    return (
+        extracted_data_dir
+        / team_slug_darwin_json_v2
+        / "nifti"
+        / "releases"
+        / "latest"
+        / "annotations"
+    )
+
+
+@pytest.fixture(scope="session")
+def parsed_annotations(
+    annotations_dir: Path,
+) -> Callable[[str], List[dt.AnnotationFile]]:
+    cache: Dict[str, List[dt.AnnotationFile]] = {}
+
+    def get(name: str) -> List[dt.AnnotationFile]:
+        if name not in cache:
+            cache[name] = list(darwin_to_dt_gen([annotations_dir / name], False))
+        # Exporting may mutate the annotations, so hand out a copy
+        return copy.deepcopy(cache[name])
+
+    return get
+
+
+def test_video_annotation_nifti_export_single_slot(
+    parsed_annotations: Callable[[str], List[dt.AnnotationFile]],
+    tmp_path: Path,
 ):
-    with patch(
-        "darwin.exporter.formats.nifti.populate_output_volumes_from_polygons"
-    ) as mock:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            with ZipFile("tests/data.zip") as zfile:
-                zfile.extractall(tmpdir)
-            annotations_dir = (
-                Path(tmpdir)
-                / team_slug_darwin_json_v2
-                / "nifti/releases/latest/annotations"
-            )
-            video_annotation_filepaths = [annotations_dir / "polygon_only.json"]
-            video_annotations = list(
-                darwin_to_dt_gen(video_annotation_filepaths, False)
-            )
-            nifti.export(video_annotations, output_dir=Path(tmpdir))
-            mock.assert_called()
+    video_annotations = parsed_annotations("hippocampus_001.nii.json")
+    nifti.export(video_annotations, output_dir=tmp_path)
+    export_im = nib.load(tmp_path / "hippocampus_001_hippocampus.nii.gz")
+    assert export_im.shape == (35, 51, 35)
 
 
-def test_export_calls_populate_output_volumes_from_raster_layer(
-    team_slug_darwin_json_v2: str,
+def test_video_annotation_nifti_export_multi_slot(
+    parsed_annotations: Callable[[str], List[dt.AnnotationFile]],
+    tmp_path: Path,
 ):
-    with patch(
-        "darwin.exporter.formats.nifti.populate_output_volumes_from_raster_layer"
-    ) as mock:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            with ZipFile("tests/data.zip") as zfile:
-                zfile.extractall(tmpdir)
-            annotations_dir = (
-                Path(tmpdir)
-                / team_slug_darwin_json_v2
-                / "nifti/releases/latest/annotations"
-            )
-            video_annotation_filepaths = [annotations_dir / "mask_only.json"]
-            video_annotations = list(
-                darwin_to_dt_gen(video_annotation_filepaths, False)
-            )
-            nifti.export(video_annotations, output_dir=Path(tmpdir))
-            mock.assert_called()
+    video_annotations = parsed_annotations("hippocampus_multislot.nii.json")
+    nifti.export(video_annotations, output_dir=tmp_path)
+    export_im = nib.load(tmp_path / "hippocampus_new_test_hippo.nii.gz")
+    assert export_im.shape == (34, 47, 40)
+
+
+def test_video_annotation_nifti_export_mpr(
+    parsed_annotations: Callable[[str], List[dt.AnnotationFile]],
+    tmp_path: Path,
+):
+    video_annotations = parsed_annotations("hippocampus_multislot_001_mpr.json")
+    nifti.export(video_annotations, output_dir=tmp_path)
+    export_im = nib.load(tmp_path / "hippocampus_001_mpr_test_hippo.nii.gz")
+    assert export_im.shape == (35, 51, 35)
 
 
+@pytest.mark.parametrize(
+    "video_annotation_file, populate_function, output_files",
+    [
+        (
+            "mask_only.json",
+            "populate_output_volumes_from_raster_layer",
+            ["hippocampus_multislot_3_test_hippo_LOIN_m.nii.gz"],
+        ),
+        (
+            "polygon_only.json",
+            "populate_output_volumes_from_polygons",
+            ["hippocampus_multislot_3_test_hippo_create_class_1.nii.gz"],
+        ),
+        (
+            "polygon_and_mask.json",
+            None,
+            [
+                "hippocampus_multislot_3_test_hippo_create_class_1.nii.gz",
+                "hippocampus_multislot_3_test_hippo_LOIN_m.nii.gz",
+            ],
+        ),
+        ("empty.json", None, ["hippocampus_multislot_3_test_hippo_.nii.gz"]),
+    ],
+)
 def test_export_creates_file_for_polygons_and_masks(
-    team_slug_darwin_json_v2: str,
+    parsed_annotations: Callable[[str], List[dt.AnnotationFile]],
+    video_annotation_file: str,
+    populate_function: Optional[str],
+    output_files: List[str],
+    tmp_path: Path,
 ):
-    with tempfile.TemporaryDirectory() as tmpdir:
-        with ZipFile("tests/data.zip") as zfile:
-            zfile.extractall(tmpdir)
-            annotations_dir = (
-                Path(tmpdir)
-                / team_slug_darwin_json_v2
-                / "nifti/releases/latest/annotations"
-            )
-            video_annotation_files = {
-                "mask_only.json": ["hippocampus_multislot_3_test_hippo_LOIN_m.nii.gz"],
-                "polygon_only.json": [
-                    "hippocampus_multislot_3_test_hippo_create_class_1.nii.gz"
-                ],
-                "polygon_and_mask.json": [
-                    "hippocampus_multislot_3_test_hippo_create_class_1.nii.gz",
-                    "hippocampus_multislot_3_test_hippo_LOIN_m.nii.gz",
-                ],
-                "empty.json": ["hippocampus_multislot_3_test_hippo_.nii.gz"],
-            }
-            for video_annotation_file in video_annotation_files:
-                video_annotation_filepaths = [annotations_dir / video_annotation_file]
-                video_annotations = list(
-                    darwin_to_dt_gen(video_annotation_filepaths, False)
-                )
-                nifti.export(video_annotations, output_dir=Path(tmpdir))
-                for output_file in video_annotation_files[video_annotation_file]:
-                    assert (
-                        Path(tmpdir) / output_file
-                    ).exists(), (
-                        f"Expected file {output_file} does not exist in {tmpdir}"
-                    )
-                # Empty the directory for the next test
-                for output_file in video_annotation_files[video_annotation_file]:
-                    (Path(tmpdir) / output_file).unlink()
+    video_annotations = parsed_annotations(video_annotation_file)
+    if populate_function is None:
+        nifti.export(video_annotations, output_dir=tmp_path)
+    else:
+        # Wrap rather than replace, so the volumes are still written
+        with patch(
+            f"darwin.exporter.formats.nifti.{populate_function}",
+            wraps=getattr(nifti, populate_function),
+        ) as mock:
+            nifti.export(video_annotations, output_dir=tmp_path)
+            mock.assert_called()
+    for output_file in output_files:
+        assert (
+            tmp_path / output_file
+        ).exists(), f"Expected file {output_file} does not exist in {tmp_path}"
+
+
+@pytest.mark.parametrize(
+    "pixdim, legacy, expected",
+    [
+        ([1, 2], True, [{"x": 20, "y": 20.0}, {"x": 40, "y": 60.0}]),
+        ([2, 1], True, [{"x": 40.0, "y": 10}, {"x": 80.0, "y": 30}]),
+        ([1, 1], True, [{"x": 20, "y": 10}, {"x": 40, "y": 30}]),
+        ([2, 4], False, [{"x": 5, "y": 5}, {"x": 10, "y": 15}]),
+    ],
+)
+def test_shift_polygon_coords(pixdim: List[int], legacy: bool, expected: List[dict]):
+    polygon = [{"x": 10, "y": 20}, {"x": 30, "y": 40}]
+    assert nifti.shift_polygon_coords(polygon, pixdim, legacy=legacy) == expected
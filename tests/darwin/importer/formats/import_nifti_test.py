@@ -4,7 +4,6 @@ import tempfile
 from pathlib import Path
 from typing import Union
 from unittest.mock import patch
-from zipfile import ZipFile
 
 import numpy as np
 import pytest
@@ -23,223 +22,213 @@ from tests.fixtures import *
 from darwin.utils.utils import parse_darwin_json
 
 
-def test_image_annotation_nifti_import_single_slot(team_slug_darwin_json_v2: str):
-    with tempfile.TemporaryDirectory() as tmpdir:
-        with ZipFile("tests/data.zip") as zfile:
-            zfile.extractall(tmpdir)
-            label_path = (
-                Path(tmpdir)
-                / team_slug_darwin_json_v2
-                / "nifti"
-                / "releases"
-                / "latest"
-                / "annotations"
-                / "vol0_brain.nii.gz"
-            )
-            input_dict = {
-                "data": [
-                    {
-                        "image": "vol0 (1).nii",
-                        "label": str(label_path),
-                        "class_map": {"1": "brain"},
-                        "mode": "video",
-                    }
-                ]
+def test_image_annotation_nifti_import_single_slot(
+    team_slug_darwin_json_v2: str, extracted_data_dir: Path, tmp_path: Path
+):
+    label_path = (
+        extracted_data_dir
+        / team_slug_darwin_json_v2
+        / "nifti"
+        / "releases"
+        / "latest"
+        / "annotations"
+        / "vol0_brain.nii.gz"
+    )
+    input_dict = {
+        "data": [
+            {
+                "image": "vol0 (1).nii",
+                "label": str(label_path),
+                "class_map": {"1": "brain"},
+                "mode": "video",
             }
-            upload_json = Path(tmpdir) / "annotations.json"
-            upload_json.write_text(
-                json.dumps(input_dict, indent=4, sort_keys=True, default=str)
-            )
-            annotation_files = parse_path(path=upload_json)
-            annotation_file = annotation_files[0]
-            output_json_string = json.loads(
-                serialise_annotation_file(annotation_file, as_dict=False)
-            )
-            expected_json_string = json.load(
-                open(
-                    Path(tmpdir)
-                    / team_slug_darwin_json_v2
-                    / "nifti"
-                    / "vol0_annotation_file.json",
-                    "r",
-                )
-            )
-            assert (
-                output_json_string["annotations"][0]["frames"]
-                == expected_json_string["annotations"][0]["frames"]
-            )
+        ]
+    }
+    upload_json = tmp_path / "annotations.json"
+    upload_json.write_text(
+        json.dumps(input_dict, indent=4, sort_keys=True, default=str)
+    )
+    annotation_files = parse_path(path=upload_json)
+    annotation_file = annotation_files[0]
+    output_json_string = json.loads(
+        serialise_annotation_file(annotation_file, as_dict=False)
+    )
+    expected_json_string = json.load(
+        open(
+            extracted_data_dir
+            / team_slug_darwin_json_v2
+            / "nifti"
+            / "vol0_annotation_file.json",
+            "r",
+        )
+    )
+    assert (
+        output_json_string["annotations"][0]["frames"]
+        == expected_json_string["annotations"][0]["frames"]
+    )
 
 
-def test_image_annotation_nifti_import_multi_slot(team_slug_darwin_json_v2: str):
-    with tempfile.TemporaryDirectory() as tmpdir:
-        with ZipFile("tests/data.zip") as zfile:
-            zfile.extractall(tmpdir)
-            label_path = (
-                Path(tmpdir)
-                / team_slug_darwin_json_v2
-                / "nifti"
-                / "releases"
-                / "latest"
-                / "annotations"
-                / "vol0_brain.nii.gz"
-            )
-            input_dict = {
-                "data": [
-                    {
-                        "image": "vol0 (1).nii",
-                        "label": str(label_path),
-                        "class_map": {"1": "brain"},
-                        "mode": "video",
-                        "is_mpr": True,
-                        "slot_names": ["0.3", "0.2", "0.1"],
-                    }
-                ]
+def test_image_annotation_nifti_import_multi_slot(
+    team_slug_darwin_json_v2: str, extracted_data_dir: Path, tmp_path: Path
+):
+    label_path = (
+        extracted_data_dir
+        / team_slug_darwin_json_v2
+        / "nifti"
+        / "releases"
+        / "latest"
+        / "annotations"
+        / "vol0_brain.nii.gz"
+    )
+    input_dict = {
+        "data": [
+            {
+                "image": "vol0 (1).nii",
+                "label": str(label_path),
+                "class_map": {"1": "brain"},
+                "mode": "video",
+                "is_mpr": True,
+                "slot_names": ["0.3", "0.2", "0.1"],
             }
-            upload_json = Path(tmpdir) / "annotations.json"
-            upload_json.write_text(
-                json.dumps(input_dict, indent=4, sort_keys=True, default=str)
-            )
+        ]
+    }
+    upload_json = tmp_path / "annotations.json"
+    upload_json.write_text(
+        json.dumps(input_dict, indent=4, sort_keys=True, default=str)
+    )
 
-            annotation_files = parse_path(path=upload_json)
-            annotation_file = annotation_files[0]
-            output_json_string = json.loads(
-                serialise_annotation_file(annotation_file, as_dict=False)
-            )
-            expected_json_string = json.load(
-                open(
-                    Path(tmpdir)
-                    / team_slug_darwin_json_v2
-                    / "nifti"
-                    / "vol0_annotation_file_multi_slot.json",
-                    "r",
-                )
-            )
-            assert (
-                output_json_string["annotations"][0]["frames"]
-                == expected_json_string["annotations"][0]["frames"]
-            )
+    annotation_files = parse_path(path=upload_json)
+    annotation_file = annotation_files[0]
+    output_json_string = json.loads(
+        serialise_annotation_file(annotation_file, as_dict=False)
+    )
+    expected_json_string = json.load(
+        open(
+            extracted_data_dir
+            / team_slug_darwin_json_v2
+            / "nifti"
+            / "vol0_annotation_file_multi_slot.json",
+            "r",
+        )
+    )
+    assert (
+        output_json_string["annotations"][0]["frames"]
+        == expected_json_string["annotations"][0]["frames"]
+    )
 
 
 def test_image_annotation_nifti_import_incorrect_number_slot(
-    team_slug_darwin_json_v2: str,
+    team_slug_darwin_json_v2: str, extracted_data_dir: Path, tmp_path: Path
 ):
-    with tempfile.TemporaryDirectory() as tmpdir:
-        with ZipFile("tests/data.zip") as zfile:
-            zfile.extractall(tmpdir)
-            label_path = (
-                Path(tmpdir)
-                / team_slug_darwin_json_v2
-                / "nifti"
-                / "releases"
-                / "latest"
-                / "annotations"
-                / "vol0_brain.nii.gz"
-            )
-            input_dict = {
-                "data": [
-                    {
-                        "image": "vol0 (1).nii",
-                        "label": str(label_path),
-                        "class_map": {"1": "brain"},
-                        "mode": "video",
-                        "is_mpr": True,
-                        "slot_names": ["0.3", "0.2"],
-                    }
-                ]
+    label_path = (
+        extracted_data_dir
+        / team_slug_darwin_json_v2
+        / "nifti"
+        / "releases"
+        / "latest"
+        / "annotations"
+        / "vol0_brain.nii.gz"
+    )
+    input_dict = {
+        "data": [
+            {
+                "image": "vol0 (1).nii",
+                "label": str(label_path),
+                "class_map": {"1": "brain"},
+                "mode": "video",
+                "is_mpr": True,
+                "slot_names": ["0.3", "0.2"],
             }
-            upload_json = Path(tmpdir) / "annotations.json"
-            upload_json.write_text(
-                json.dumps(input_dict, indent=4, sort_keys=True, default=str)
-            )
-            with pytest.raises(Exception):
-                parse_path(path=upload_json)
+        ]
+    }
+    upload_json = tmp_path / "annotations.json"
+    upload_json.write_text(
+        json.dumps(input_dict, indent=4, sort_keys=True, default=str)
+    )
+    with pytest.raises(Exception):
+        parse_path(path=upload_json)
 
 
 def test_image_annotation_nifti_import_single_slot_to_mask_legacy(
-    team_slug_darwin_json_v2: str,
+    team_slug_darwin_json_v2: str, extracted_data_dir: Path, tmp_path: Path
 ):
-    with tempfile.TemporaryDirectory() as tmpdir:
-        with ZipFile("tests/data.zip") as zfile:
-            zfile.extractall(tmpdir)
-            label_path = (
-                Path(tmpdir)
-                / team_slug_darwin_json_v2
-                / "nifti"
-                / "releases"
-                / "latest"
-                / "annotations"
-                / "sample_nifti.nii"
-            )
-            input_dict = {
-                "data": [
-                    {
-                        "image": "2044737.fat.nii",
-                        "label": str(label_path),
-                        "class_map": {"1": "brain"},
-                        "mode": "mask",
-                        "is_mpr": False,
-                        "slot_names": ["0.1"],
-                    }
-                ]
+    label_path = (
+        extracted_data_dir
+        / team_slug_darwin_json_v2
+        / "nifti"
+        / "releases"
+        / "latest"
+        / "annotations"
+        / "sample_nifti.nii"
+    )
+    input_dict = {
+        "data": [
+            {
+                "image": "2044737.fat.nii",
+                "label": str(label_path),
+                "class_map": {"1": "brain"},
+                "mode": "mask",
+                "is_mpr": False,
+                "slot_names": ["0.1"],
             }
-            upload_json = Path(tmpdir) / "annotations.json"
-            upload_json.write_text(
-                json.dumps(input_dict, indent=4, sort_keys=True, default=str)
-            )
+        ]
+    }
+    upload_json = tmp_path / "annotations.json"
+    upload_json.write_text(
+        json.dumps(input_dict, indent=4, sort_keys=True, default=str)
+    )
 
-            with patch("darwin.importer.formats.nifti.zoom") as mock_zoom:
-                mock_zoom.side_effect = ndimage.zoom
-
-                remote_files_that_require_legacy_scaling = {
-                    Path("/2044737.fat.nii"): {
-                        "0": np.array(
-                            [
-                                [2.23214293, 0, 0, -247.76787233],
-                                [0, 2.23214293, 0, -191.96429443],
-                                [0, 0, 3, -21],
-                                [0, 0, 0, 1],
-                            ]
-                        )
-                    }
-                }
-                annotation_files = parse_path(
-                    path=upload_json,
-                    remote_files_that_require_legacy_scaling=remote_files_that_require_legacy_scaling,
-                )
-                annotation_file = annotation_files[0]
-                output_json_string = json.loads(
-                    serialise_annotation_file(annotation_file, as_dict=False)
+    with patch("darwin.importer.formats.nifti.zoom") as mock_zoom:
+        mock_zoom.side_effect = ndimage.zoom
+
+        remote_files_that_require_legacy_scaling = {
+            Path("/2044737.fat.nii"): {
+                "0": np.array(
+                    [
+                        [2.23214293, 0, 0, -247.76787233],
+                        [0, 2.23214293, 0, -191.96429443],
+                        [0, 0, 3, -21],
+                        [0, 0, 0, 1],
+                    ]
                 )
-                expected_json_string = json.load(
-                    open(
-                        Path(tmpdir)
-                        / team_slug_darwin_json_v2
-                        / "nifti"
-                        / "sample_nifti.nii.json",
-                        "r",
-                    )
-                )
-                # This needs to not check for mask_annotation_ids_mapping as these
-                # are randomly generated
-                [
-                    frame.get("raster_layer", {}).pop("mask_annotation_ids_mapping")
-                    for frame in output_json_string["annotations"][0]["frames"].values()
-                ]
-                [
-                    frame.get("raster_layer", {}).pop("mask_annotation_ids_mapping")
-                    for frame in expected_json_string["annotations"][1][
-                        "frames"
-                    ].values()
-                ]
+            }
+        }
+        annotation_files = parse_path(
+            path=upload_json,
+            remote_files_that_require_legacy_scaling=remote_files_that_require_legacy_scaling,
+        )
+        annotation_file = annotation_files[0]
+        output_json_string = json.loads(
+            serialise_annotation_file(annotation_file, as_dict=False)
+        )
+        expected_json_string = json.load(
+            open(
+                extracted_data_dir
+                / team_slug_darwin_json_v2
+                / "nifti"
+                / "sample_nifti.nii.json",
+                "r",
+            )
+        )
+        # This needs to not check for mask_annotation_ids_mapping as these
+        # are randomly generated
+        [
+            frame.get("raster_layer", {}).pop("mask_annotation_ids_mapping")
+            for frame in output_json_string["annotations"][0]["frames"].values()
+        ]
+        [
+            frame.get("raster_layer", {}).pop("mask_annotation_ids_mapping")
+            for frame in expected_json_string["annotations"][1]["frames"].values()
+        ]
 
-                assert (
-                    mock_zoom.call_count
-                    == expected_json_string["item"]["slots"][0]["frame_count"]
-                )
-                assert (
-                    output_json_string["annotations"][0]["frames"]
-                    == expected_json_string["annotations"][1]["frames"]
-                )
+        assert (
+            mock_zoom.call_count
+            == expected_json_string["item"]["slots"][0]["frame_count"]
+        )
+        assert (
+            output_json_string["annotations"][0]["frames"]
+            == expected_json_string["annotations"][1]["frames"]
+        )
 
 
 def test_get_new_axial_size():
@@ -256,7 +245,9 @@ def test_get_new_axial_size_with_isotropic():
     assert new_size == (20, 10)
 
 
-def test_process_nifti_orientation_ras_to_lpi(team_slug_darwin_json_v2):
+def test_process_nifti_orientation_ras_to_lpi(
+    team_slug_darwin_json_v2: str, extracted_data_dir: Path
+):
     """
     Test that an input NifTI annotation file in the RAS orientation is correctly
     transformed to the LPI orientation.
@@ -265,30 +256,29 @@ def test_process_nifti_orientation_ras_to_lpi(team_slug_darwin_json_v2):
     - 1: Transforms the input file into the RAS orientation
     - 2: Transforms the transformed RAS file into the LPI orientation
     """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        with ZipFile("tests/data.zip") as zfile:
-            zfile.extractall(tmpdir)
-            filepath = (
-                Path(tmpdir)
-                / team_slug_darwin_json_v2
-                / "nifti"
-                / "releases"
-                / "latest"
-                / "annotations"
-                / "vol0_brain.nii.gz"
-            )
-            lpi_ornt = [[0.0, -1.0], [1.0, -1.0], [2.0, -1.0]]
-            ras_file = nib.load(filepath)
-            ras_transformed_file = nib.funcs.as_closest_canonical(ras_file)
-            lpi_transformed_file = nib.orientations.apply_orientation(
-                ras_transformed_file.get_fdata(), lpi_ornt
-            )
-            processed_file, _ = process_nifti(input_data=ras_file)
-            assert not np.array_equal(processed_file, ras_file._dataobj)
-            assert np.array_equal(processed_file, lpi_transformed_file)
+    filepath = (
+        extracted_data_dir
+        / team_slug_darwin_json_v2
+        / "nifti"
+        / "releases"
+        / "latest"
+        / "annotations"
+        / "vol0_brain.nii.gz"
+    )
+    lpi_ornt = [[0.0, -1.0], [1.0, -1.0], [2.0, -1.0]]
+    ras_file = nib.load(filepath)
+    ras_transformed_file = nib.funcs.as_closest_canonical(ras_file)
+    lpi_transformed_file = nib.orientations.apply_orientation(
+        np.asarray(ras_transformed_file.dataobj), lpi_ornt
+    )
+    processed_file, _ = process_nifti(input_data=ras_file)
+    assert not np.array_equal(processed_file, ras_file._dataobj)
+    assert np.array_equal(processed_file, lpi_transformed_file)
 
 
-def test_process_nifti_orientation_las_to_lpi(team_slug_darwin_json_v2):
+def test_process_nifti_orientation_las_to_lpi(
+    team_slug_darwin_json_v2: str, extracted_data_dir: Path
+):
     """
     Test that an input NifTI annotation file in the LAS orientation is correctly
     transformed to the LPI orientation.
@@ -297,27 +287,24 @@ def test_process_nifti_orientation_las_to_lpi(team_slug_darwin_json_v2):
     - 1: Transforms the input file into the RAS orientation
     - 2: Transforms the transformed RAS file into the LPI orientation
     """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        with ZipFile("tests/data.zip") as zfile:
-            zfile.extractall(tmpdir)
-            filepath = (
-                Path(tmpdir)
-                / team_slug_darwin_json_v2
-                / "nifti"
-                / "releases"
-                / "latest"
-                / "annotations"
-                / "BRAINIX_NIFTI_ROI.nii.gz"
-            )
-            lpi_ornt = [[0.0, -1.0], [1.0, -1.0], [2.0, -1.0]]
-            las_file = nib.load(filepath)
-            ras_transformed_file = nib.funcs.as_closest_canonical(las_file)
-            lpi_transformed_file = nib.orientations.apply_orientation(
-                ras_transformed_file.get_fdata(), lpi_ornt
-            )
-            processed_file, _ = process_nifti(input_data=las_file)
-            assert not np.array_equal(processed_file, las_file._dataobj)
-            assert np.array_equal(processed_file, lpi_transformed_file)
+    filepath = (
+        extracted_data_dir
+        / team_slug_darwin_json_v2
+        / "nifti"
+        / "releases"
+        / "latest"
+        / "annotations"
+        / "BRAINIX_NIFTI_ROI.nii.gz"
+    )
+    lpi_ornt = [[0.0, -1.0], [1.0, -1.0], [2.0, -1.0]]
+    las_file = nib.load(filepath)
+    ras_transformed_file = nib.funcs.as_closest_canonical(las_file)
+    lpi_transformed_file = nib.orientations.apply_orientation(
+        np.asarray(ras_transformed_file.dataobj), lpi_ornt
+    )
+    processed_file, _ = process_nifti(input_data=las_file)
+    assert not np.array_equal(processed_file, las_file._dataobj)
+    assert np.array_equal(processed_file, lpi_transformed_file)
 
 
 def serialise_annotation_file(
@@ -1,12 +1,14 @@
 import sys
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Dict, Tuple, Type
 from unittest.mock import patch
 
 import numpy as np
+import pytest
 import torch
 
 from darwin.config import Config
+from darwin.dataset.local_dataset import LocalDataset
 from darwin.torch.dataset import (
     ClassificationDataset,
     InstanceSegmentationDataset,
@@ -17,30 +19,66 @@ from darwin.torch.dataset import (
 from tests.fixtures import *  # noqa: F403
 
 
+@pytest.fixture(scope="session")
+def load_dataset(
+    extracted_data_dir: Path, team_slug_darwin_json_v2: str
+) -> Callable[[Type[LocalDataset], str], LocalDataset]:
+    cache: Dict[Tuple[Type[LocalDataset], str], LocalDataset] = {}
+
+    def get(dataset_class: Type[LocalDataset], name: str) -> LocalDataset:
+        # Shared across tests, so callers must not mutate the returned dataset
+        key = (dataset_class, name)
+        if key not in cache:
+            cache[key] = dataset_class(
+                dataset_path=extracted_data_dir / team_slug_darwin_json_v2 / name,
+                release_name="latest",
+            )
+        return cache[key]
+
+    return get
+
+
 def generic_dataset_test(ds, n, size):
-    weights = ds.measure_weights()
     img = ds[0][0]
     assert img.shape[-2] == size[0] and img.shape[-1] == size[1]
+    assert len(ds) == n
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize(
+    "dataset_class, name",
+    [
+        (ClassificationDataset, "sl"),
+        (ClassificationDataset, "ml"),
+        (InstanceSegmentationDataset, "coco"),
+        (SemanticSegmentationDataset, "coco"),
+        (ObjectDetectionDataset, "coco"),
+    ],
+)
+def test_measure_weights(
+    load_dataset: Callable[[Type[LocalDataset], str], LocalDataset],
+    dataset_class: Type[LocalDataset],
+    name: str,
+) -> None:
+    ds = load_dataset(dataset_class, name)
+    weights = ds.measure_weights()
     assert len(weights) == len(ds.classes)
     assert np.isclose(np.sum(weights), 1)
-    assert len(ds) == n
 
 
 class TestClassificationDataset:
     def test_should_correctly_create_a_single_label_dataset(
-        self, team_slug_darwin_json_v2: str, team_extracted_dataset_path: Path
+        self, load_dataset: Callable[[Type[LocalDataset], str], LocalDataset]
     ) -> None:
-        root = team_extracted_dataset_path / team_slug_darwin_json_v2 / "sl"
-        ds = ClassificationDataset(dataset_path=root, release_name="latest")
+        ds = load_dataset(ClassificationDataset, "sl")
 
         generic_dataset_test(ds, n=20, size=(50, 50))
         assert not ds.is_multi_label
 
     def test_should_correctly_create_a_multi_label_dataset(
-        self, team_slug_darwin_json_v2: str, team_extracted_dataset_path: Path
+        self, load_dataset: Callable[[Type[LocalDataset], str], LocalDataset]
     ) -> None:
-        root = team_extracted_dataset_path / team_slug_darwin_json_v2 / "ml"
-        ds = ClassificationDataset(dataset_path=root, release_name="latest")
+        ds = load_dataset(ClassificationDataset, "ml")
 
         generic_dataset_test(ds, n=20, size=(50, 50))
         assert ds.is_multi_label
@@ -48,10 +86,9 @@ class TestClassificationDataset:
 
 class TestInstanceSegmentationDataset:
     def test_should_correctly_create_a_instance_seg_dataset(
-        self, team_slug_darwin_json_v2: str, team_extracted_dataset_path: Path
+        self, load_dataset: Callable[[Type[LocalDataset], str], LocalDataset]
     ) -> None:
-        root = team_extracted_dataset_path / team_slug_darwin_json_v2 / "coco"
-        ds = InstanceSegmentationDataset(dataset_path=root, release_name="latest")
+        ds = load_dataset(InstanceSegmentationDataset, "coco")
 
         generic_dataset_test(ds, n=20, size=(50, 50))
         assert isinstance(ds[0][1], dict)
@@ -59,10 +96,9 @@ class TestInstanceSegmentationDataset:
 
 class TestSemanticSegmentationDataset:
     def test_should_correctly_create_a_semantic_seg_dataset(
-        self, team_slug_darwin_json_v2: str, team_extracted_dataset_path: Path
+        self, load_dataset: Callable[[Type[LocalDataset], str], LocalDataset]
     ) -> None:
-        root = team_extracted_dataset_path / team_slug_darwin_json_v2 / "coco"
-        ds = SemanticSegmentationDataset(dataset_path=root, release_name="latest")
+        ds = load_dataset(SemanticSegmentationDataset, "coco")
 
         generic_dataset_test(ds, n=20, size=(50, 50))
         assert isinstance(ds[0][1], dict)
@@ -70,10 +106,9 @@ class TestSemanticSegmentationDataset:
 
 class TestObjectDetectionDataset:
     def test_should_correctly_create_a_object_detection_dataset(
-        self, team_slug_darwin_json_v2: str, team_extracted_dataset_path: Path
+        self, load_dataset: Callable[[Type[LocalDataset], str], LocalDataset]
     ) -> None:
-        root = team_extracted_dataset_path / team_slug_darwin_json_v2 / "coco"
-        ds = ObjectDetectionDataset(dataset_path=root, release_name="latest")
+        ds = load_dataset(ObjectDetectionDataset, "coco")
 
         generic_dataset_test(ds, n=20, size=(50, 50))
         assert isinstance(ds[0][1], dict)
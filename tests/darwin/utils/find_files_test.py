@@ -1,54 +1,52 @@
+import tempfile
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, Iterator, Optional
 from unittest import TestCase
 from unittest.mock import patch
 
+import darwin.utils.utils
 from darwin.exceptions import UnsupportedFileType
 from darwin.utils import (
     SUPPORTED_EXTENSIONS,
     SUPPORTED_IMAGE_EXTENSIONS,
     find_files,
+    iter_files,
 )
 
 
 class FindFileTestCase(TestCase):
-    fake_invalid_files = [
+    fake_invalid_files = (
         "/testdir.invalidextension",
         "/testdir/testdir2.invalidextension",
-    ]
-    fake_supported_files = [f"testdir/testfile{ext}" for ext in SUPPORTED_EXTENSIONS]
-    fake_supported_files_varied_case = [
+    )
+    fake_supported_files = tuple(
+        f"testdir/testfile{ext}" for ext in SUPPORTED_EXTENSIONS
+    )
+    fake_supported_files_varied_case = tuple(
         f"testdir/testdir2/testfile{ext.upper()}" for ext in SUPPORTED_EXTENSIONS
-    ]
-    fake_files = [
+    )
+    fake_files = (
         "testdir/testdir2/testfile.png",
         "testdir/testdir2/testfile2.png",
         "testdir/testfile.png",
         *fake_supported_files,
         *fake_supported_files_varied_case,
-    ]
+    )
     fake_file_expected_length = len(fake_files) - len(fake_invalid_files)
 
-    def setUp(self) -> None:
-        return super().setUp()
-
-    def tearDown(self) -> None:
-        return super().tearDown()
-
 
 class TestFindFiles(FindFileTestCase):
-    @patch("darwin.utils.is_extension_allowed_by_filename", return_value=True)
-    def test_find_files_returns_a_list_of_files(self, mock_is_extension_allowed):
+    @patch("darwin.utils.is_extension_allowed_by_filename", new=lambda filename: True)
+    def test_find_files_returns_a_list_of_files(self):
         output = find_files(self.fake_files, files_to_exclude=[], recursive=False)
 
         self.assertIsInstance(output, list)
-        [self.assertIsInstance(file, Path) for file in output]
+        for file in output:
+            self.assertIsInstance(file, Path)
 
-    @patch("darwin.utils.is_extension_allowed_by_filename", return_value=True)
-    def test_find_files_excludes_files_in_excluded_list(
-        self, mock_is_extension_allowed
-    ):
+    @patch("darwin.utils.is_extension_allowed_by_filename", new=lambda filename: True)
+    def test_find_files_excludes_files_in_excluded_list(self):
         output = find_files(
             self.fake_files,
             files_to_exclude=[
@@ -60,59 +58,79 @@ class TestFindFiles(FindFileTestCase):
 
         self.assertEqual(len(self.fake_files) - 2, len(output))
 
-    @patch("darwin.utils.is_extension_allowed_by_filename", return_value=False)
-    def test_raises_error_unsupported_filetype(self, mock_is_extension_allowed):
+    @patch("darwin.utils.is_extension_allowed_by_filename", new=lambda filename: False)
+    def test_raises_error_unsupported_filetype(self):
         with self.assertRaises(UnsupportedFileType):
             find_files(["1"], files_to_exclude=[], recursive=False)
 
-    @patch("darwin.utils.is_extension_allowed_by_filename")
-    def test_uses_correct_glob_if_recursive(self, mock_is_extension_allowed):
-        with patch("darwin.utils.Path.is_dir") as mock_is_dir:
-            with patch("darwin.utils.Path.glob") as mock_glob:
-                mock_is_dir.return_value = True
-                mock_glob.return_value = ["1"]
-
-                find_files(["123"], files_to_exclude=[], recursive=True)
-
-                self.assertTrue(mock_glob.called)
-                self.assertEqual(mock_glob.call_args[0][0], "**/*")
-
-    @patch("darwin.utils.is_extension_allowed_by_filename")
-    def test_glob_results_in_correct_call_to_is_extension_allowed_by_filename(
-        self, mock_is_extension_allowed
-    ):
-        mock_is_extension_allowed.return_value = True
-        with patch("darwin.utils.Path.is_dir") as mock_is_dir:
-            with patch("darwin.utils.Path.glob") as mock_glob:
-                mock_is_dir.return_value = True
-                mock_glob.return_value = [
-                    Path("1.png"),
-                    Path("1/b/c/2.png"),
-                    Path("1/b/c/3.png"),
-                ]
-
-                result = find_files(["1"], files_to_exclude=[], recursive=True)
-
-                self.assertEqual(
-                    result,
-                    [
-                        Path("1.png"),
-                        Path("1/b/c/2.png"),
-                        Path("1/b/c/3.png"),
-                    ],
-                )
-
-    @patch("darwin.utils.is_extension_allowed_by_filename")
-    def test_uses_correct_glob_if_not_recursive(self, mock_is_extension_allowed):
-        with patch("darwin.utils.Path.is_dir") as mock_is_dir:
-            with patch("darwin.utils.Path.glob") as mock_glob:
-                mock_is_dir.return_value = True
-                mock_glob.return_value = ["1"]
-
-                find_files(["1"], files_to_exclude=[], recursive=False)
-
-                self.assertTrue(mock_glob.called)
-                self.assertEqual(mock_glob.call_args[0][0], "*")
+    def test_does_not_walk_files(self):
+        with patch("darwin.utils.utils._scan_directory") as mock_scan_directory:
+            output = find_files(self.fake_files, files_to_exclude=[], recursive=True)
+
+            mock_scan_directory.assert_not_called()
+            self.assertEqual(output, [Path(file) for file in self.fake_files])
+
+    def test_only_walks_subdirectories_if_recursive(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            for name in ["1.png", "1.txt", "b/c/2.png", "b/c/3.nii.gz"]:
+                (root / name).parent.mkdir(parents=True, exist_ok=True)
+                (root / name).touch()
+
+            for recursive, parallel, expected in [
+                (
+                    True,
+                    False,
+                    [root / "1.png", root / "b/c/2.png", root / "b/c/3.nii.gz"],
+                ),
+                (
+                    True,
+                    True,
+                    [root / "1.png", root / "b/c/2.png", root / "b/c/3.nii.gz"],
+                ),
+                (False, False, [root / "1.png"]),
+                (False, True, [root / "1.png"]),
+            ]:
+                with self.subTest(recursive=recursive, parallel=parallel):
+                    result = find_files(
+                        [root],
+                        files_to_exclude=[],
+                        recursive=recursive,
+                        sort=True,
+                        parallel=parallel,
+                    )
+
+                    self.assertEqual(result, expected)
+
+
+class TestIterFiles(FindFileTestCase):
+    def test_yields_the_same_files_as_find_files(self):
+        output = iter_files(self.fake_files, files_to_exclude=[], recursive=False)
+
+        self.assertIsInstance(output, Iterator)
+        self.assertEqual(
+            list(output),
+            find_files(self.fake_files, files_to_exclude=[], recursive=False),
+        )
+
+    def test_parallel_walk_lists_at_most_four_directories_ahead(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            for index in range(10):
+                (root / str(index)).mkdir()
+                (root / str(index) / "1.png").touch()
+
+            with patch(
+                "darwin.utils.utils._list_directory",
+                wraps=darwin.utils.utils._list_directory,
+            ) as mock_list_directory:
+                output = iter_files([root], parallel=True)
+                next(output)
+                # Closing waits for the listings already handed to the thread pool
+                output.close()
+
+            # The root listing, then the first four of its ten subdirectories
+            self.assertEqual(mock_list_directory.call_count, 5)
 
 
 class TestIsExtensionAllowedByFilenameFunctions(FindFileTestCase):
@@ -139,28 +157,17 @@ class TestIsExtensionAllowedByFilenameFunctions(FindFileTestCase):
             *self.fake_supported_files,
             *self.fake_supported_files_varied_case,
         ]
-        results = [self.dependency_factory().ieabf(file) for file in valid_extensions]
-
-        self.assertTrue(all(results))
+        deps = self.dependency_factory()
+        self.assertTrue(all(deps.ieabf(file) for file in valid_extensions))
 
     def test_ieabf_returns_false_for_an_invalid_extension(self):
-        results = [
-            self.dependency_factory().ieabf(file) for file in self.fake_invalid_files
-        ]
-
-        self.assertFalse(all(results))
+        deps = self.dependency_factory()
+        self.assertFalse(any(deps.ieabf(file) for file in self.fake_invalid_files))
 
     def test_iieabf_returns_true_for_a_valid_extension(self):
-        results = [
-            self.dependency_factory().iieabf(file)
-            for file in SUPPORTED_IMAGE_EXTENSIONS
-        ]
-
-        self.assertTrue(all(results))
+        deps = self.dependency_factory()
+        self.assertTrue(all(deps.iieabf(file) for file in SUPPORTED_IMAGE_EXTENSIONS))
 
     def test_iieabf_returns_false_for_an_invalid_extension(self):
-        results = [
-            self.dependency_factory().iieabf(file) for file in self.fake_invalid_files
-        ]
-
-        self.assertFalse(all(results))
+        deps = self.dependency_factory()
+        self.assertFalse(any(deps.iieabf(file) for file in self.fake_invalid_files))
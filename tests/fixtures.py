@@ -1,4 +1,7 @@
+import hashlib
+import os
 import shutil
+import tempfile
 from datetime import datetime
 from pathlib import Path
 from typing import Generator, List
@@ -27,17 +30,17 @@ def darwin_datasets_path(darwin_path: Path) -> Path:
     return darwin_path / "datasets"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def team_slug_darwin_json_v2() -> str:
     return "v7-darwin-json-v2"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def dataset_name() -> str:
     return "test_dataset"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def dataset_slug() -> str:
     return "test-dataset"
 
@@ -54,13 +57,51 @@ def team_dataset_path(
     return darwin_datasets_path / team_slug_darwin_json_v2 / dataset_name
 
 
-@pytest.fixture
-def team_extracted_dataset_path(darwin_datasets_path: Path):
+@pytest.fixture(scope="session")
+def data_zip() -> Generator[ZipFile, None, None]:
     with ZipFile("./tests/data.zip", "r") as zipObj:
-        zipObj.extractall(path=darwin_datasets_path)
+        yield zipObj
+
+
+@pytest.fixture
+def team_extracted_dataset_path(darwin_datasets_path: Path, extracted_data_dir: Path):
+    # Copied rather than linked, since tests such as split_dataset write into it
+    shutil.copytree(extracted_data_dir, darwin_datasets_path, dirs_exist_ok=True)
     return darwin_datasets_path
 
 
+@pytest.fixture(scope="session")
+def extracted_data_dir(
+    pytestconfig: pytest.Config,
+    tmp_path_factory: pytest.TempPathFactory,
+    data_zip: ZipFile,
+) -> Path:
+    # Tests must treat its contents as read-only, since it may outlive the session
+    cache = getattr(pytestconfig, "cache", None)
+    if cache is None:
+        data_dir = tmp_path_factory.mktemp("data")
+        data_zip.extractall(path=data_dir)
+        return data_dir
+
+    # Keyed by the archive's hash, so a changed data.zip is extracted afresh
+    digest = hashlib.sha256(Path("./tests/data.zip").read_bytes()).hexdigest()
+    cache_dir = cache.mkdir("darwin_data")
+    data_dir = cache_dir / digest
+    if not data_dir.exists():
+        # Each run extracts into its own directory, so concurrent runs don't collide
+        partial_dir = Path(tempfile.mkdtemp(suffix=".partial", dir=cache_dir))
+        try:
+            data_zip.extractall(path=partial_dir)
+            os.replace(partial_dir, data_dir)
+        except OSError:
+            # Fine if another run moved its extraction into place first
+            if not data_dir.exists():
+                raise
+        finally:
+            shutil.rmtree(partial_dir, ignore_errors=True)
+    return data_dir
+
+
 @pytest.fixture
 def team_dataset_release_path(team_dataset_path: Path, release_name: str) -> Path:
     return team_dataset_path / "releases" / release_name
@@ -82,29 +123,32 @@ def annotations_path(team_dataset_release_path: Path) -> Path:
 
 
 @pytest.fixture
-def file_read_write_test(darwin_path: Path, annotations_path: Path, split_path: Path):
-    # Executed before the test
+def file_read_write_test(annotations_path: Path, split_path: Path):
+    # Everything lives under tmp_path, which pytest cleans up itself
     annotations_path.mkdir(parents=True)
     split_path.mkdir(parents=True)
 
-    # Useful if the test needs to reuse attrs
-    yield
 
-    # Executed after the test
-    shutil.rmtree(darwin_path)
+def _move(src: Path, dst: Path) -> None:
+    # A plain rename when possible; shutil.move copies across filesystems
+    try:
+        os.replace(src, dst)
+    except OSError:
+        shutil.move(src, dst)
 
 
 @pytest.fixture
 def local_config_file(
     team_slug_darwin_json_v2: str, darwin_datasets_path: Path
 ) -> Generator[Config, None, None]:
-    darwin_path = Path.home() / ".darwin"
-    backup_darwin_path = Path.home() / ".darwin_backup"
+    home = Path.home()
+    darwin_path = home / ".darwin"
+    backup_darwin_path = home / ".darwin_backup"
     config_path = darwin_path / "config.yaml"
 
     # Executed before the test
     if darwin_path.exists():
-        shutil.move(str(darwin_path), str(backup_darwin_path))
+        _move(darwin_path, backup_darwin_path)
     darwin_path.mkdir()
 
     config = Config(config_path)
@@ -121,7 +165,7 @@ def local_config_file(
     # Executed after the test
     shutil.rmtree(darwin_path)
     if backup_darwin_path.exists():
-        shutil.move(backup_darwin_path, darwin_path)
+        _move(backup_darwin_path, darwin_path)
 
 
 @pytest.fixture